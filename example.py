@@ -2,6 +2,8 @@
 """Example usage of the tspy client demonstrating all GET/LIST APIs."""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from tspy import TailscaleClient
 
 # Get API key from environment variable
@@ -15,15 +17,121 @@ if not api_key:
 # Initialize client
 client = TailscaleClient(api_key=api_key, tailnet=tailnet)
 
+# Time windows for the logging endpoints, all derived from a single UTC "now".
+# Truncating to whole seconds keeps the query strings (and cache keys) stable.
+RFC3339 = "%Y-%m-%dT%H:%M:%SZ"
+NOW = datetime.now(timezone.utc)
+audit_window = ((NOW - timedelta(days=1)).strftime(RFC3339), NOW.strftime(RFC3339))
+network_window = ((NOW - timedelta(hours=1)).strftime(RFC3339), NOW.strftime(RFC3339))
+
+
+
+def section(title, future, fmt, indent=""):
+    """Print ``title``, then ``fmt(result)`` or the error the call raised."""
+    print(title)
+    try:
+        fmt(future.result())
+    except Exception as e:
+        print(f"{indent}Error: {e}")
+
+
+def print_list(label, items):
+    """Print ``items`` comma-separated after ``label``."""
+    print(label, end=" ")
+    print(*items, sep=", ")
+
+
+def print_bundle(bundle):
+    print(f"  Name: {bundle.device.name}")
+    print(f"  Created: {bundle.device.created}")
+    print(f"  Last seen: {bundle.device.last_seen}")
+    print(f"  Advertised routes: {bundle.routes.get('advertisedRoutes', [])}")
+    print(f"  Enabled routes: {bundle.routes.get('enabledRoutes', [])}")
+    print(f"  Attributes: {bundle.attributes}")
+
+
+def print_user_detail(user_detail):
+    print(f"  Display name: {user_detail.display_name}")
+    print(f"  Created: {user_detail.created}")
+    print(f"  Device count: {user_detail.device_count}")
+
+
+def print_acl(acl):
+    print(f"ACL has {len(acl.acls)} rules")
+    if acl.groups:
+        print_list("Groups defined:", acl.groups.keys())
+    if acl.tag_owners:
+        print_list("Tag owners defined:", acl.tag_owners.keys())
+
+
+def print_dns(dns):
+    print(f"  Magic DNS: {dns.magic_dns}")
+    if dns.domains:
+        print_list("  Domains:", dns.domains)
+    if dns.nameservers:
+        print_list("  Nameservers:", dns.nameservers)
+
+
+def print_mapping(heading):
+    """Return a formatter printing ``heading`` and then each key/value pair."""
+    def fmt(mapping):
+        print(heading)
+        for key, value in mapping.items():
+            print(f"  {key}: {value}")
+    return fmt
+
+
+def print_sample(noun, fmt_item, indent=""):
+    """Return a formatter printing a count of ``noun`` and the first 3 items."""
+    def fmt(items):
+        print(f"{indent}Found {len(items)} {noun}")
+        for item in items[:3]:
+            print(f"{indent}  - {fmt_item(item)}")
+    return fmt
+
+
+def print_logs(noun):
+    """Return a formatter printing a count of log entries and the latest one."""
+    def fmt(logs):
+        print(f"  Found {len(logs)} {noun}")
+        if logs:
+            print(f"  Latest entry: {logs[0]}")
+    return fmt
+
+
+# All of the calls below are independent of each other, so issue them up front
+# and only wait on each result when its section is printed.
+executor = ThreadPoolExecutor(max_workers=16)
+first_device_future = executor.submit(next, client.iter_devices(), None)
+users_future = executor.submit(client.list_users)
+user_invites_future = executor.submit(client.list_user_invites)
+acl_future = executor.submit(client.get_acl)
+dns_future = executor.submit(client.get_dns_config)
+nameservers_future = executor.submit(client.get_nameservers)
+searchpaths_future = executor.submit(client.get_searchpaths)
+split_dns_future = executor.submit(client.get_split_dns)
+api_keys_future = executor.submit(client.list_api_keys)
+settings_future = executor.submit(client.get_tailnet_settings)
+contacts_future = executor.submit(client.get_contacts)
+webhooks_future = executor.submit(client.list_webhooks)
+integrations_future = executor.submit(client.list_posture_integrations)
+audit_logs_future = executor.submit(
+    client.get_configuration_audit_logs, start=audit_window[0], end=audit_window[1]
+)
+network_logs_future = executor.submit(
+    client.get_network_logs, start=network_window[0], end=network_window[1]
+)
+
 # List devices
 print("=== DEVICES ===")
-print("\nListing all devices:")
-devices = client.list_devices()
-print(f"Found {len(devices)} devices")
+print("\nFetching the first device:")
+# iter_devices() pages lazily, so only the first page is needed here
+device = first_device_future.result()
+
+if device:
+    # Second wave: the device, routes and attributes lookups depend on the ID
+    bundle_future = executor.submit(client.get_device_bundle, device.id)
 
-if devices:
-    # Show first device details
-    device = devices[0]
     print(f"\nFirst device: {device.name}")
     print(f"  ID: {device.id}")
     print(f"  Node ID: {device.node_id}")
@@ -31,195 +139,62 @@ if devices:
     print(f"  OS: {device.os}")
     print(f"  Authorized: {device.authorized}")
     if device.tailscale_ips:
-        print(f"  IPs: {', '.join(device.tailscale_ips)}")
-    
-    # Get device details
-    print(f"\nGetting device details for {device.id}:")
-    device_detail = client.get_device(device.id)
-    print(f"  Name: {device_detail.name}")
-    print(f"  Created: {device_detail.created}")
-    print(f"  Last seen: {device_detail.last_seen}")
-    
-    # Get device routes
-    print(f"\nGetting routes for device {device.id}:")
-    try:
-        routes = client.get_device_routes(device.id)
-        print(f"  Advertised routes: {routes.get('advertisedRoutes', [])}")
-        print(f"  Enabled routes: {routes.get('enabledRoutes', [])}")
-    except Exception as e:
-        print(f"  Error getting routes: {e}")
-    
-    # Get device attributes
-    print(f"\nGetting attributes for device {device.id}:")
-    try:
-        attrs = client.get_device_attributes(device.id)
-        print(f"  Attributes: {attrs}")
-    except Exception as e:
-        print(f"  Error getting attributes: {e}")
+        print_list("  IPs:", device.tailscale_ips)
+
+    section(f"\nGetting device details, routes and attributes for {device.id}:",
+            bundle_future, print_bundle, indent="  ")
 
 # List users
 print("\n\n=== USERS ===")
 print("\nListing all users:")
-users = client.list_users()
+users = users_future.result()
 print(f"Found {len(users)} users")
 
 if users:
     # Show first user details
     user = users[0]
+    user_detail_future = executor.submit(client.get_user, user.id)
     print(f"\nFirst user: {user.display_name}")
     print(f"  ID: {user.id}")
     print(f"  Login: {user.login_name}")
     print(f"  Role: {user.role}")
     print(f"  Status: {user.status}")
-    
-    # Get user details
-    print(f"\nGetting user details for {user.id}:")
-    try:
-        user_detail = client.get_user(user.id)
-        print(f"  Display name: {user_detail.display_name}")
-        print(f"  Created: {user_detail.created}")
-        print(f"  Device count: {user_detail.device_count}")
-    except Exception as e:
-        print(f"  Error getting user details: {e}")
-
-# List user invites
-print("\n\n=== USER INVITES ===")
-try:
-    invites = client.list_user_invites()
-    print(f"Found {len(invites)} user invites")
-    for invite in invites[:3]:  # Show first 3
-        print(f"  - {invite.get('email')} (Role: {invite.get('role')})")
-except Exception as e:
-    print(f"Error listing user invites: {e}")
-
-# Get ACL
-print("\n\n=== ACL ===")
-try:
-    acl = client.get_acl()
-    print(f"ACL has {len(acl.acls)} rules")
-    if acl.groups:
-        print(f"Groups defined: {', '.join(acl.groups.keys())}")
-    if acl.tag_owners:
-        print(f"Tag owners defined: {', '.join(acl.tag_owners.keys())}")
-except Exception as e:
-    print(f"Error getting ACL: {e}")
+
+    section(f"\nGetting user details for {user.id}:", user_detail_future,
+            print_user_detail, indent="  ")
+
+section("\n\n=== USER INVITES ===", user_invites_future,
+        print_sample("user invites", lambda invite: f"{invite.email} (Role: {invite.role})"))
+section("\n\n=== ACL ===", acl_future, print_acl)
 
 # DNS Configuration
 print("\n\n=== DNS ===")
-print("\nGetting DNS preferences:")
-dns = client.get_dns_config()
-print(f"  Magic DNS: {dns.magic_dns}")
-if dns.domains:
-    print(f"  Domains: {', '.join(dns.domains)}")
-if dns.nameservers:
-    print(f"  Nameservers: {', '.join(dns.nameservers)}")
-
-# Get nameservers
-print("\nGetting nameservers:")
-try:
-    nameservers = client.get_nameservers()
-    print(f"  Nameservers: {', '.join(nameservers)}")
-except Exception as e:
-    print(f"  Error getting nameservers: {e}")
-
-# Get search paths
-print("\nGetting search paths:")
-try:
-    searchpaths = client.get_searchpaths()
-    print(f"  Search paths: {', '.join(searchpaths)}")
-except Exception as e:
-    print(f"  Error getting search paths: {e}")
-
-# Get split DNS
-print("\nGetting split DNS configuration:")
-try:
-    split_dns = client.get_split_dns()
-    print(f"  Split DNS: {split_dns}")
-except Exception as e:
-    print(f"  Error getting split DNS: {e}")
-
-# List API keys
+section("\nGetting DNS preferences:", dns_future, print_dns, indent="  ")
+section("\nGetting nameservers:", nameservers_future,
+        lambda nameservers: print_list("  Nameservers:", nameservers), indent="  ")
+section("\nGetting search paths:", searchpaths_future,
+        lambda searchpaths: print_list("  Search paths:", searchpaths), indent="  ")
+section("\nGetting split DNS configuration:", split_dns_future,
+        lambda split_dns: print(f"  Split DNS: {split_dns}"), indent="  ")
+
 print("\n\n=== KEYS ===")
-print("\nListing API keys:")
-try:
-    api_keys = client.list_api_keys()
-    print(f"Found {len(api_keys)} API keys")
-    for key in api_keys[:3]:  # Show first 3
-        print(f"  - {key.get('id')} ({key.get('description', 'No description')})")
-except Exception as e:
-    print(f"Error listing API keys: {e}")
-
-# Get tailnet settings
-print("\n\n=== TAILNET SETTINGS ===")
-try:
-    settings = client.get_tailnet_settings()
-    print("Tailnet settings:")
-    for key, value in settings.items():
-        print(f"  {key}: {value}")
-except Exception as e:
-    print(f"Error getting tailnet settings: {e}")
-
-# Get contacts
-print("\n\n=== CONTACTS ===")
-try:
-    contacts = client.get_contacts()
-    print("Contact preferences:")
-    for contact_type, email in contacts.items():
-        print(f"  {contact_type}: {email}")
-except Exception as e:
-    print(f"Error getting contacts: {e}")
-
-# List webhooks
-print("\n\n=== WEBHOOKS ===")
-try:
-    webhooks = client.list_webhooks()
-    print(f"Found {len(webhooks)} webhooks")
-    for webhook in webhooks[:3]:  # Show first 3
-        print(f"  - {webhook.get('endpointUrl')} (Type: {webhook.get('providerType')})")
-except Exception as e:
-    print(f"Error listing webhooks: {e}")
-
-# List posture integrations
-print("\n\n=== DEVICE POSTURE INTEGRATIONS ===")
-try:
-    integrations = client.list_posture_integrations()
-    print(f"Found {len(integrations)} posture integrations")
-    for integration in integrations[:3]:  # Show first 3
-        print(f"  - {integration.get('id')} (Provider: {integration.get('provider')})")
-except Exception as e:
-    print(f"Error listing posture integrations: {e}")
-
-# Get log configuration
+section("\nListing API keys:", api_keys_future,
+        print_sample("API keys", lambda key: f"{key.id} ({key.description or 'No description'})"))
+section("\n\n=== TAILNET SETTINGS ===", settings_future, print_mapping("Tailnet settings:"))
+section("\n\n=== CONTACTS ===", contacts_future, print_mapping("Contact preferences:"))
+section("\n\n=== WEBHOOKS ===", webhooks_future,
+        print_sample("webhooks", lambda webhook: f"{webhook.endpoint_url} (Type: {webhook.provider_type})"))
+section("\n\n=== DEVICE POSTURE INTEGRATIONS ===", integrations_future,
+        print_sample("posture integrations",
+                     lambda integration: f"{integration.id} (Provider: {integration.provider})"))
+
 print("\n\n=== LOGGING ===")
-print("\nGetting configuration audit logs (last 24 hours):")
-try:
-    from datetime import datetime, timedelta
-    end_time = datetime.now()
-    start_time = end_time - timedelta(days=1)
-    logs = client.get_configuration_audit_logs(
-        start=start_time.isoformat() + "Z",
-        end=end_time.isoformat() + "Z"
-    )
-    print(f"  Found {len(logs)} audit log entries")
-    if logs:
-        print(f"  Latest entry: {logs[0]}")
-except Exception as e:
-    print(f"  Error getting configuration audit logs: {e}")
-
-# Get network logs (requires logs:network:read OAuth scope)
-print("\nGetting network logs (last hour):")
-try:
-    end_time = datetime.now()
-    start_time = end_time - timedelta(hours=1)
-    logs = client.get_network_logs(
-        start=start_time.isoformat() + "Z",
-        end=end_time.isoformat() + "Z"
-    )
-    print(f"  Found {len(logs)} log entries")
-    if logs:
-        print(f"  Latest entry: {logs[0]}")
-except Exception as e:
-    print(f"  Error getting network logs: {e}")
-    print("  Note: This requires logs:network:read OAuth scope")
-
-print("\n\nExample completed!")
\ No newline at end of file
+section("\nGetting configuration audit logs (last 24 hours):", audit_logs_future,
+        print_logs("audit log entries"), indent="  ")
+# Network logs require the logs:network:read OAuth scope
+section("\nGetting network logs (last hour, requires logs:network:read OAuth scope):",
+        network_logs_future, print_logs("log entries"), indent="  ")
+
+executor.shutdown()
+
+print("\n\nExample completed!")
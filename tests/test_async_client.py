@@ -0,0 +1,145 @@
+"""Tests for the asyncio Tailscale client."""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+from tspy import AsyncTailscaleClient, TspyAPIError, TspyError
+from tspy.async_client import run
+
+aiohttp = pytest.importorskip("aiohttp")
+web = pytest.importorskip("aiohttp.web")
+TestServer = pytest.importorskip("aiohttp.test_utils").TestServer
+
+
+@asynccontextmanager
+async def serve(responses):
+    """Serve ``responses`` ({(method, path): (status, body)}) on a local test server.
+
+    Yields the API base URL and the list of (method, raw path) requests received.
+    """
+    seen = []
+
+    async def handle(request):
+        seen.append((request.method, request.raw_path))
+        status, body = responses[request.method, request.path]
+        return web.Response(status=status, body=json.dumps(body) if body is not None else None,
+                            content_type="application/json")
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handle)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        yield str(server.make_url("/api/v2")), seen
+    finally:
+        await server.close()
+
+
+DEVICE = {"addresses": [], "authorized": True, "hostname": "h", "name": "n", "os": "linux", "user": "u"}
+
+
+class TestAsyncTailscaleClient:
+    def test_create_opens_and_close_releases_session(self):
+        async def main():
+            client = await AsyncTailscaleClient.create(api_key="test-key")
+            session = client.session
+            assert isinstance(session, aiohttp.ClientSession)
+            assert session.headers["Authorization"] == "Bearer test-key"
+            await client.close()
+            assert session.closed
+            assert client.session is None
+            with pytest.raises(TspyError):
+                await client.get_device("d1")
+        
+        asyncio.run(main())
+    
+    def test_list_devices_quotes_tailnet(self):
+        async def main():
+            responses = {
+                ("GET", "/api/v2/tailnet/user@example.com/devices"):
+                    (200, {"devices": [dict(DEVICE, id="d1"), dict(DEVICE, id="d2")]}),
+            }
+            async with serve(responses) as (base_url, seen):
+                async with AsyncTailscaleClient(api_key="test-key", tailnet="user@example.com",
+                                                base_url=base_url) as client:
+                    assert client._tailnet_path == "/tailnet/user%40example.com"
+                    devices = await client.list_devices()
+            
+            assert [device.id for device in devices] == ["d1", "d2"]
+            assert seen == [("GET", "/api/v2/tailnet/user@example.com/devices?fields=all")]
+        
+        asyncio.run(main())
+    
+    def test_list_user_invites_validates_models(self):
+        async def main():
+            responses = {
+                ("GET", "/api/v2/tailnet/test.com/user-invites"):
+                    (200, {"invites": [{"id": "i1", "role": "member", "email": "a@test.com"}]}),
+            }
+            async with serve(responses) as (base_url, _):
+                async with AsyncTailscaleClient(api_key="test-key", tailnet="test.com",
+                                                base_url=base_url) as client:
+                    return await client.list_user_invites()
+        
+        invites = asyncio.run(main())
+        
+        assert [(invite.id, invite.email) for invite in invites] == [("i1", "a@test.com")]
+    
+    def test_list_all_device_routes_and_context_manager(self):
+        async def main():
+            responses = {
+                ("GET", "/api/v2/tailnet/test.com/devices"):
+                    (200, {"devices": [dict(DEVICE, id="d1"), dict(DEVICE, id="d2")]}),
+                ("GET", "/api/v2/device/d1/routes"): (200, {"advertisedRoutes": ["10.0.0.0/24"]}),
+                ("GET", "/api/v2/device/d2/routes"): (200, {"advertisedRoutes": []}),
+            }
+            async with serve(responses) as (base_url, seen):
+                async with AsyncTailscaleClient(api_key="test-key", tailnet="test.com",
+                                                base_url=base_url) as client:
+                    session = client.session
+                    routes = await client.list_all_device_routes()
+                    only_d2 = await client.list_all_device_routes(["d2"])
+            
+            assert session.closed
+            assert client.session is None
+            assert routes == {"d1": {"advertisedRoutes": ["10.0.0.0/24"]}, "d2": {"advertisedRoutes": []}}
+            assert only_d2 == {"d2": {"advertisedRoutes": []}}
+            assert seen[0] == ("GET", "/api/v2/tailnet/test.com/devices?fields=default")
+            assert len(seen) == 4
+        
+        asyncio.run(main())
+    
+    def test_api_error_handling(self):
+        async def main():
+            responses = {("GET", "/api/v2/device/missing"): (404, {"message": "not found"})}
+            async with serve(responses) as (base_url, _):
+                async with AsyncTailscaleClient(api_key="test-key", base_url=base_url) as client:
+                    with pytest.raises(TspyAPIError) as exc_info:
+                        await client.get_device("missing")
+            return exc_info.value
+        
+        error = asyncio.run(main())
+        
+        assert error.status_code == 404
+        assert error.response_data == {"message": "not found"}
+    
+    def test_delete_devices_runs_every_delete(self):
+        async def main():
+            responses = {("DELETE", f"/api/v2/device/{i}"): (200, None) for i in ("d1", "d2", "d3")}
+            async with serve(responses) as (base_url, seen):
+                async with AsyncTailscaleClient(api_key="test-key", base_url=base_url) as client:
+                    await client.delete_devices(["d1", "d2", "d3"])
+            return seen
+        
+        seen = asyncio.run(main())
+        
+        assert sorted(seen) == [("DELETE", f"/api/v2/device/{i}") for i in ("d1", "d2", "d3")]
+    
+    def test_run_returns_result(self):
+        async def main():
+            await asyncio.sleep(0)
+            return "done"
+        
+        assert run(main()) == "done"
@@ -1,9 +1,13 @@
 """Tests for the Tailscale client."""
 
+import io
+import json
+import pickle
+
 import pytest
 import requests.exceptions
-from unittest.mock import Mock, patch
-from tspy import TailscaleClient, TspyAPIError
+from unittest.mock import MagicMock, Mock, patch
+from tspy import Device, TailscaleClient, TspyAPIError, TspyError
 
 
 class TestTailscaleClient:
@@ -14,7 +18,6 @@ class TestTailscaleClient:
     @pytest.fixture
     def mock_response(self):
         mock = Mock()
-        mock.json.return_value = {}
         mock.content = b'{"test": "data"}'
         mock.raise_for_status.return_value = None
         return mock
@@ -24,9 +27,24 @@ class TestTailscaleClient:
         assert client.tailnet == "test.com"
         assert client.base_url == "https://api.tailscale.com/api/v2"
     
+    def test_precomputed_tailnet_url_and_auth(self):
+        client = TailscaleClient(api_key="test-key", tailnet="user@example.com")
+        assert client._tailnet_url == "https://api.tailscale.com/api/v2/tailnet/user%40example.com"
+        assert client.session.headers["Authorization"] == "Bearer test-key"
+        assert "gzip" in client.session.headers["Accept-Encoding"]
+    
+    @patch('requests.Session.close')
+    def test_connection_pool_and_context_manager(self, mock_close):
+        with TailscaleClient(api_key="test-key", pool_maxsize=64) as client:
+            adapter = client.session.get_adapter("https://api.tailscale.com")
+            assert adapter._pool_maxsize == 64
+            assert 429 in adapter.max_retries.status_forcelist
+            assert client.session.get_adapter("http://localhost") is adapter
+        mock_close.assert_called_once()
+    
     @patch('requests.Session.request')
     def test_list_devices(self, mock_request, client, mock_response):
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "devices": [
                 {
                     "id": "device1",
@@ -40,7 +58,7 @@ class TestTailscaleClient:
                     "user": "user@test.com"
                 }
             ]
-        }
+        }).encode()
         mock_request.return_value = mock_response
         
         devices = client.list_devices()
@@ -50,9 +68,158 @@ class TestTailscaleClient:
         assert devices[0].hostname == "test-device"
         mock_request.assert_called_once_with(
             "GET",
-            "https://api.tailscale.com/api/v2/tailnet/test.com/devices"
+            "https://api.tailscale.com/api/v2/tailnet/test.com/devices",
+            params={"fields": "all"}
         )
     
+    @patch('requests.Session.request')
+    def test_iter_devices_follows_cursor(self, mock_request, client):
+        device = {"addresses": [], "authorized": True, "hostname": "h",
+                  "name": "n", "os": "linux", "user": "u"}
+        pages = [
+            {"devices": [dict(device, id="d1")], "nextCursor": "c1"},
+            {"devices": [dict(device, id="d2")]},
+        ]
+        mock_request.side_effect = [Mock(content=json.dumps(page).encode()) for page in pages]
+        
+        devices = client.iter_devices(page_size=1)
+        
+        assert next(devices).id == "d1"
+        assert mock_request.call_count == 1
+        assert [d.id for d in devices] == ["d2"]
+        assert mock_request.call_args.kwargs["params"] == {"fields": "all", "limit": 1, "cursor": "c1"}
+    
+    @patch('requests.Session.request')
+    def test_list_user_invites_fast(self, mock_request, client, mock_response):
+        pytest.importorskip("msgspec")
+        mock_response.content = json.dumps({"invites": [
+            {"id": "i1", "role": "member", "email": "a@test.com", "createdAt": "2024-01-01T00:00:00Z"},
+        ]}).encode()
+        mock_request.return_value = mock_response
+        
+        invites = client.list_user_invites_fast()
+        
+        assert [(i.id, i.email, i.created_at.year) for i in invites] == [("i1", "a@test.com", 2024)]
+    
+    @patch('requests.Session.request')
+    def test_get_network_logs_fast(self, mock_request, client, mock_response):
+        pytest.importorskip("msgspec")
+        mock_response.content = json.dumps({"logs": [{
+            "logged": "2024-01-01T00:00:10Z", "nodeId": "n1", "start": "2024-01-01T00:00:00Z",
+            "end": "2024-01-01T00:00:05Z", "virtualTraffic": [{"proto": 6, "txBytes": 10}],
+        }]}).encode()
+        mock_request.return_value = mock_response
+        
+        logs = client.get_network_logs_fast(start="2024-01-01T00:00:00Z")
+        
+        assert [(log.node_id, log.virtual_traffic) for log in logs] == [("n1", [{"proto": 6, "txBytes": 10}])]
+        mock_response.content = b'{"logs": [{"nodeId": "n1"}]}'
+        with pytest.raises(TspyError):
+            client.get_network_logs_fast()
+    
+    @patch('requests.Session.request')
+    def test_api_and_auth_key_listings_share_one_request(self, mock_request, client, mock_response):
+        mock_response.content = b'{"keys": [{"id": "k1"}, {"id": "k2"}]}'
+        mock_request.return_value = mock_response
+        
+        assert [key.id for key in client.list_api_keys()] == ["k1", "k2"]
+        assert client.list_auth_keys() == [{"id": "k1"}, {"id": "k2"}]
+        assert mock_request.call_count == 1
+        
+        client.delete_api_key("k1")
+        client.list_auth_keys()
+        assert mock_request.call_count == 3
+    
+    @patch('requests.Session.request')
+    def test_key_listings_are_isolated_and_skip_stale_writes(self, mock_request, client):
+        keys = b'{"keys": [{"id": "k1", "capabilities": {"devices": {"create": {"tags": []}}}}]}'
+        
+        def respond(method, url, **kwargs):
+            if method == "GET" and mock_request.call_count == 1:
+                # A delete lands while this listing is still in flight.
+                client.delete_api_key("k2")
+            return Mock(content=keys if method == "GET" else b'')
+        mock_request.side_effect = respond
+        
+        client.list_auth_keys()[0]["capabilities"]["devices"]["create"]["tags"].append("tag:x")
+        assert mock_request.call_count == 2
+        
+        assert client.list_api_keys()[0].capabilities == {"devices": {"create": {"tags": []}}}
+        client.list_auth_keys()[0]["capabilities"]["devices"]["create"]["tags"].append("tag:x")
+        assert client.list_api_keys()[0].capabilities == {"devices": {"create": {"tags": []}}}
+        assert mock_request.call_count == 3
+    
+    @patch('requests.Session.request')
+    def test_get_device_bundle(self, mock_request, client):
+        bodies = {
+            "/device/d1": {"id": "d1", "addresses": [], "authorized": True, "hostname": "h",
+                           "name": "n", "os": "linux", "user": "u"},
+            "/device/d1/routes": {"advertisedRoutes": ["10.0.0.0/24"], "enabledRoutes": []},
+            "/device/d1/attributes": {"attributes": {"node:os": "linux"}},
+        }
+        
+        def respond(method, url, **kwargs):
+            return Mock(content=json.dumps(bodies[url.split("/api/v2", 1)[1]]).encode())
+        mock_request.side_effect = respond
+        
+        bundle = client.get_device_bundle("d1")
+        
+        assert bundle.device.id == "d1"
+        assert bundle.routes["advertisedRoutes"] == ["10.0.0.0/24"]
+        assert bundle.attributes == {"attributes": {"node:os": "linux"}}
+    
+    @patch('requests.Session.request')
+    def test_get_devices_with_details(self, mock_request, client):
+        device = {"addresses": [], "authorized": True, "hostname": "h", "name": "n", "os": "linux", "user": "u"}
+        bodies = {
+            "/tailnet/test.com/devices": {"devices": [dict(device, id="d1"), dict(device, id="d2")]},
+            "/device/d1/routes": {"advertisedRoutes": ["10.0.0.0/24"]},
+            "/device/d2/routes": {"advertisedRoutes": []},
+            "/device/d1/device-invites": {"invites": []},
+            "/device/d2/device-invites": {"invites": [{"id": "i1"}]},
+        }
+        
+        def respond(method, url, **kwargs):
+            return Mock(content=json.dumps(bodies[url.split("/api/v2", 1)[1]]).encode())
+        mock_request.side_effect = respond
+        
+        bundles = client.get_devices_with_details(include=("routes", "invites"))
+        
+        assert [b.device.id for b in bundles] == ["d1", "d2"]
+        assert bundles[0].routes == {"advertisedRoutes": ["10.0.0.0/24"]}
+        assert bundles[1].invites == [{"id": "i1"}]
+        assert bundles[1].attributes is None
+        with pytest.raises(TspyError):
+            client.get_devices_with_details(include=("keys",))
+    
+    def test_models_accept_field_names_and_empty_timestamps(self):
+        device = Device(id="d1", addresses=[], authorized=True, hostname="h", name="n",
+                        os="linux", user="u", node_id="n1", last_seen="", unknown="x")
+        assert device.node_id == "n1"
+        assert device.last_seen is None
+        assert not hasattr(device, "unknown")
+    
+    @patch('requests.Session.request')
+    def test_authorize_device_sends_preserialized_body(self, mock_request, client, mock_response):
+        mock_response.content = b''
+        mock_request.return_value = mock_response
+        
+        client.authorize_device("d1", authorized=False)
+        
+        assert mock_request.call_args.kwargs["data"] == b'{"authorized":false}'
+        assert client.session.headers["Content-Type"] == "application/json"
+    
+    @patch('requests.Session.request')
+    def test_delete_devices_runs_every_delete(self, mock_request, client, mock_response):
+        mock_response.content = b''
+        mock_request.return_value = mock_response
+        
+        client.delete_devices(["d1", "d2", "d3"], max_workers=2)
+        
+        urls = sorted(call.args[1] for call in mock_request.call_args_list)
+        assert urls == [f"https://api.tailscale.com/api/v2/device/{i}" for i in ("d1", "d2", "d3")]
+        assert {call.args[0] for call in mock_request.call_args_list} == {"DELETE"}
+    
     @patch('requests.Session.request')
     def test_api_error_handling(self, mock_request, client):
         mock_response = Mock()
@@ -66,4 +233,229 @@ class TestTailscaleClient:
         with pytest.raises(TspyAPIError) as exc_info:
             client.list_devices()
         
-        assert exc_info.value.status_code == 404
\ No newline at end of file
+        assert exc_info.value.status_code == 404
+    
+    def test_api_error_pickles_with_slots(self):
+        error = pickle.loads(pickle.dumps(TspyAPIError("not found", status_code=404,
+                                                       response_data={"message": "nope"})))
+        assert str(error) == "not found"
+        assert error.status_code == 404
+        assert error.response_data == {"message": "nope"}
+    
+    @patch('requests.Session.request')
+    def test_response_cache(self, mock_request, mock_response, tmp_path):
+        pytest.importorskip("diskcache")
+        client = TailscaleClient(api_key="test-key", tailnet="test.com",
+                                 cache_ttl=60, cache_dir=str(tmp_path / "tspy"))
+        assert (tmp_path / "tspy").stat().st_mode & 0o777 == 0o700
+        mock_response.content = b'{"dns": ["8.8.8.8"]}'
+        mock_response.status_code = 200
+        mock_response.headers = {"ETag": '"v1"'}
+        mock_request.return_value = mock_response
+        
+        assert client.get_nameservers() == ["8.8.8.8"]
+        assert client.get_nameservers() == ["8.8.8.8"]
+        assert mock_request.call_count == 1
+        
+        client.set_nameservers(["1.1.1.1"])
+        client.get_nameservers()
+        assert mock_request.call_count == 3
+    
+    @patch('requests.Session.request')
+    def test_response_cache_dropped_by_any_write(self, mock_request, tmp_path):
+        pytest.importorskip("diskcache")
+        client = TailscaleClient(api_key="test-key", tailnet="test.com",
+                                 cache_ttl=60, cache_dir=str(tmp_path))
+        device = {"id": "d1", "addresses": [], "authorized": True, "hostname": "h",
+                  "name": "n", "os": "linux", "user": "u"}
+        mock_request.side_effect = [
+            Mock(status_code=200, content=json.dumps({"devices": [device]}).encode(), headers={}),
+            Mock(status_code=200, content=b''),
+            Mock(status_code=200, content=b'{"devices": []}', headers={}),
+        ]
+        
+        assert [d.id for d in client.list_devices()] == ["d1"]
+        key = client._cache.key(f"{client._tailnet_url}/devices", {"fields": "all"})
+        assert client._cache._cache.get(key, expire_time=True)[1] is not None
+        client.delete_device("d1")
+        
+        assert client.list_devices() == []
+        assert mock_request.call_count == 3
+    
+    @patch('requests.Session.request')
+    def test_config_endpoints_revalidate_with_etag(self, mock_request, client):
+        mock_request.side_effect = [
+            Mock(status_code=200, content=b'{"acls": []}', headers={"ETag": '"v1"'}),
+            Mock(status_code=304, content=b'', headers={}),
+        ]
+        
+        first = client.get_acl()
+        first.acls.append({"action": "accept"})
+        second = client.get_acl()
+        
+        assert second.acls == []
+        assert mock_request.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    
+    @patch('requests.Session.request')
+    def test_iter_network_logs_streams(self, mock_request, client):
+        pytest.importorskip("ijson")
+        mock_response = MagicMock()
+        mock_response.raw = io.BytesIO(b'{"logs": [{"logged": "a"}, {"logged": "b"}]}')
+        mock_request.return_value = mock_response
+        
+        logs = client.iter_network_logs(start="2024-01-01T00:00:00Z")
+        
+        assert next(logs) == {"logged": "a"}
+        assert list(logs) == [{"logged": "b"}]
+        mock_request.assert_called_once_with(
+            "GET",
+            "https://api.tailscale.com/api/v2/tailnet/test.com/logging/network",
+            stream=True,
+            params={"start": "2024-01-01T00:00:00Z"}
+        )
+    
+    @patch('requests.Session.request')
+    def test_get_configuration_audit_logs_streams(self, mock_request, client):
+        pytest.importorskip("ijson")
+        mock_response = MagicMock(status_code=200)
+        mock_response.raw = io.BytesIO(b'{"logs": [{"action": "CREATE"}]}')
+        mock_request.return_value = mock_response
+        
+        logs = client.get_configuration_audit_logs(start="2024-01-01T00:00:00Z", actor="alice")
+        
+        assert logs == [{"action": "CREATE"}]
+        assert mock_request.call_args.kwargs["stream"] is True
+        assert mock_request.call_args.kwargs["params"] == {"start": "2024-01-01T00:00:00Z", "actor": "alice"}
+    
+    @patch('requests.Session.request')
+    def test_streamed_listing_handles_empty_and_malformed_bodies(self, mock_request, client):
+        pytest.importorskip("ijson")
+        mock_request.return_value = MagicMock(status_code=200, raw=io.BytesIO(b''))
+        assert client.get_configuration_audit_logs(start="2024-01-01T00:00:00Z") == []
+        
+        mock_request.return_value = MagicMock(status_code=200, raw=io.BytesIO(b'{"logs": [{"a'))
+        with pytest.raises(TspyAPIError) as exc_info:
+            client.get_configuration_audit_logs(start="2024-01-01T00:00:00Z")
+        assert exc_info.value.status_code == 200
+    
+    @patch('tspy.client.time.sleep')
+    @patch('requests.Session.request')
+    def test_poll_configuration_audit_logs(self, mock_request, mock_sleep, client):
+        first = {"eventTime": "2024-01-01T00:00:01Z", "action": "CREATE"}
+        second = {"eventTime": "2024-01-01T00:00:05Z", "action": "UPDATE"}
+        third = {"eventTime": "2024-01-01T00:00:09Z", "action": "DELETE"}
+        mock_request.side_effect = [
+            Mock(status_code=200, headers={"ETag": '"a"'}, content=json.dumps({"logs": [first, second]}).encode()),
+            Mock(status_code=304),
+            Mock(status_code=200),
+            Mock(status_code=200, headers={"ETag": '"b"'}, content=json.dumps({"logs": [second, third]}).encode()),
+        ]
+        
+        logs = client.poll_configuration_audit_logs(start="2024-01-01T00:00:00Z", poll_interval=1)
+        
+        assert [next(logs), next(logs), next(logs)] == [first, second, third]
+        methods = [call.args[0] for call in mock_request.call_args_list]
+        assert methods == ["GET", "HEAD", "HEAD", "GET"]
+        assert mock_request.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"a"'}
+        assert mock_request.call_args.kwargs["params"] == {"start": "2024-01-01T00:00:05Z"}
+    
+    @patch('requests.Session.request')
+    def test_response_cache_remembers_not_found(self, mock_request, tmp_path):
+        pytest.importorskip("diskcache")
+        client = TailscaleClient(api_key="test-key", tailnet="test.com",
+                                 cache_ttl=60, cache_dir=str(tmp_path))
+        mock_response = Mock()
+        mock_error = requests.exceptions.HTTPError("404 Not Found")
+        mock_error.response = Mock(status_code=404, content=b'{"message": "not found"}')
+        mock_response.raise_for_status.side_effect = mock_error
+        mock_request.return_value = mock_response
+        
+        for _ in range(2):
+            with pytest.raises(TspyAPIError) as exc_info:
+                client.list_posture_integrations()
+            assert exc_info.value.status_code == 404
+        assert mock_request.call_count == 1
+        
+        client.clear_cache(negative_only=True)
+        with pytest.raises(TspyAPIError):
+            client.list_posture_integrations()
+        assert mock_request.call_count == 2
+    
+    def test_http2_client_maps_errors(self):
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        client = TailscaleClient(api_key="test-key", tailnet="test.com", http2=True)
+        assert isinstance(client.session, httpx.Client)
+        
+        request = httpx.Request("GET", "https://api.tailscale.com/api/v2/tailnet/test.com/users")
+        response = httpx.Response(404, json={"message": "not found"}, request=request)
+        with patch.object(httpx.Client, "request", return_value=response):
+            with pytest.raises(TspyAPIError) as exc_info:
+                client.list_users()
+        
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.response_data == {"message": "not found"}
+        client.close()
+    
+    def test_http2_client_streams_log_items(self):
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        pytest.importorskip("ijson")
+        client = TailscaleClient(api_key="test-key", tailnet="test.com", http2=True)
+        
+        request = httpx.Request("GET", "https://api.tailscale.com/api/v2/tailnet/test.com/logging/network")
+        response = httpx.Response(200, content=b'{"logs": [{"logged": "a"}, {"logged": "b"}]}', request=request)
+        with patch.object(httpx.Client, "send", return_value=response) as mock_send:
+            logs = list(client.iter_network_logs(start="2024-01-01T00:00:00Z"))
+        
+        assert logs == [{"logged": "a"}, {"logged": "b"}]
+        assert mock_send.call_args.kwargs["stream"] is True
+        client.close()
+    
+    @patch('requests.post')
+    def test_from_oauth_reuses_cached_token(self, mock_post, tmp_path):
+        pytest.importorskip("diskcache")
+        mock_post.return_value = Mock()
+        mock_post.return_value.json.return_value = {"access_token": "tskey-token", "expires_in": 3600}
+        
+        for _ in range(2):
+            client = TailscaleClient.from_oauth("client-id", "secret", tailnet="test.com",
+                                                cache_token=True, cache_dir=str(tmp_path))
+            assert client.session.headers["Authorization"] == "Bearer tskey-token"
+        
+        mock_post.assert_called_once_with(
+            "https://api.tailscale.com/api/v2/oauth/token",
+            data={"client_id": "client-id", "client_secret": "secret"},
+            timeout=30
+        )
+    
+    @patch('tspy.client.time.monotonic')
+    @patch('requests.Session.request')
+    def test_device_lookups_are_memoized_until_mutation(self, mock_request, mock_monotonic, mock_response):
+        client = TailscaleClient(api_key="test-key", tailnet="test.com", device_cache_ttl=60)
+        mock_response.content = b'{"advertisedRoutes": [], "enabledRoutes": []}'
+        mock_request.return_value = mock_response
+        mock_monotonic.return_value = 0
+        
+        client.get_device_routes("d1")
+        client.get_device_routes("d2")
+        client.get_device_routes("d1")["advertisedRoutes"].append("10.0.0.0/24")
+        assert client.get_device_routes("d1") == {"advertisedRoutes": [], "enabledRoutes": []}
+        assert mock_request.call_count == 2
+        
+        client.set_device_routes("d1", ["10.0.0.0/24"])
+        client.get_device_routes("d1")
+        assert mock_request.call_count == 4
+        
+        mock_monotonic.return_value = 60
+        client.get_device_routes("d1")
+        assert mock_request.call_count == 5
+    
+    @patch('requests.Session.request')
+    def test_device_lookups_are_not_memoized_by_default(self, mock_request, client, mock_response):
+        mock_response.content = b'{"advertisedRoutes": [], "enabledRoutes": []}'
+        mock_request.return_value = mock_response
+        
+        client.get_device_routes("d1")
+        client.get_device_routes("d1")
+        assert mock_request.call_count == 2
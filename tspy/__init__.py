@@ -2,17 +2,43 @@
 
 __version__ = "0.1.0"
 
-from .client import TailscaleClient
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from .exceptions import TspyError, TspyAPIError
-from .models import (
-    Device, User, ACL, DNSConfig, DeviceRoutes, DevicePostureAttributes,
-    DeviceInvite, UserInvite, ApiKey, AuthKey, LogEntry, ContactPreference,
-    Webhook, TailnetSettings, PostureIntegration
-)
+
+if TYPE_CHECKING:
+    from .client import TailscaleClient
+    from .async_client import AsyncTailscaleClient
+    from .models import (
+        Device, User, ACL, DNSConfig, DeviceRoutes, DeviceBundle, DevicePostureAttributes,
+        DeviceInvite, UserInvite, ApiKey, AuthKey, LogEntry, ContactPreference,
+        Webhook, TailnetSettings, PostureIntegration
+    )
 
 __all__ = [
-    "TailscaleClient", "TspyError", "TspyAPIError",
-    "Device", "User", "ACL", "DNSConfig", "DeviceRoutes", "DevicePostureAttributes",
+    "TailscaleClient", "AsyncTailscaleClient", "TspyError", "TspyAPIError",
+    "Device", "User", "ACL", "DNSConfig", "DeviceRoutes", "DeviceBundle", "DevicePostureAttributes",
     "DeviceInvite", "UserInvite", "ApiKey", "AuthKey", "LogEntry", "ContactPreference",
-    "Webhook", "TailnetSettings", "PostureIntegration"
-]
\ No newline at end of file
+    "Webhook", "TailnetSettings", "PostureIntegration",
+]
+
+# The clients and models pull in requests, pydantic and friends, so they are
+# only imported on first access; `import tspy` alone stays cheap. Exported
+# names not listed here are models.
+_LAZY = {
+    "TailscaleClient": ".client",
+    "AsyncTailscaleClient": ".async_client",
+}
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY.get(name, ".models"), __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,583 @@
+"""Asyncio-based Tailscale API v2 client implementation."""
+
+import asyncio
+from typing import Any, Coroutine, Dict, List, Optional, Literal, TypeVar
+from urllib.parse import quote
+
+from pydantic import TypeAdapter
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - optional dependency
+    from json import loads as _loads  # type: ignore[assignment]
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None  # type: ignore[assignment]
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional dependency, unavailable on Windows
+    uvloop = None  # type: ignore[assignment]
+
+from .models import (
+    Device, User, UserInvite, ACL, DNSConfig, ApiKey, Webhook, PostureIntegration
+)
+from .exceptions import TspyError, TspyAPIError
+
+T = TypeVar("T")
+
+# Compiled once, these validate a whole list in pydantic-core rather than
+# constructing each model from Python.
+_DEVICE_LIST = TypeAdapter(List[Device])
+_USER_LIST = TypeAdapter(List[User])
+_USER_INVITE_LIST = TypeAdapter(List[UserInvite])
+_KEY_LIST = TypeAdapter(List[ApiKey])
+_WEBHOOK_LIST = TypeAdapter(List[Webhook])
+_POSTURE_INTEGRATION_LIST = TypeAdapter(List[PostureIntegration])
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Run ``main`` to completion, on a uvloop event loop when uvloop is installed.
+    
+    The event loop implementation has to be chosen before the loop starts, so
+    use this in place of ``asyncio.run`` rather than switching loops from inside
+    ``AsyncTailscaleClient.create``.
+    """
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
+
+
+class AsyncTailscaleClient:
+    """Asyncio client for interacting with the Tailscale API v2.
+
+    Mirrors the method surface of ``TailscaleClient`` with ``async def``
+    methods, so independent calls can be overlapped with ``asyncio.gather``.
+    Requires the optional ``aiohttp`` dependency (``pip install tspy[async]``).
+
+    Instances should be created with ``await AsyncTailscaleClient.create(...)``
+    or used as ``async with AsyncTailscaleClient(...) as client:`` so the
+    underlying ``aiohttp.ClientSession`` is bound to the running loop.
+    """
+    
+    def __init__(self, api_key: str, tailnet: str = "-", base_url: str = "https://api.tailscale.com/api/v2"):
+        """
+        Initialize the async Tailscale client without opening a session.
+        
+        Args:
+            api_key: Your Tailscale API key
+            tailnet: Your tailnet name (default: "-" for the default tailnet)
+            base_url: Base URL for the API (default: https://api.tailscale.com/api/v2)
+        """
+        self.api_key = api_key
+        self.tailnet = tailnet
+        self.base_url = base_url.rstrip("/")
+        # Quoted once, matching TailscaleClient, so tailnet names like
+        # user@example.com are sent as a single path segment.
+        self._tailnet_path = f"/tailnet/{quote(tailnet, safe='')}"
+        self.session: Optional["aiohttp.ClientSession"] = None
+    
+    @classmethod
+    async def create(cls, api_key: str, tailnet: str = "-",
+                     base_url: str = "https://api.tailscale.com/api/v2") -> "AsyncTailscaleClient":
+        """Create a client whose HTTP session is bound to the running event loop."""
+        client = cls(api_key, tailnet=tailnet, base_url=base_url)
+        client._open()
+        return client
+    
+    def _open(self) -> None:
+        """Open the HTTP session; must be called from inside the event loop."""
+        if aiohttp is None:
+            raise TspyError("AsyncTailscaleClient requires aiohttp: pip install tspy[async]")
+        self.session = aiohttp.ClientSession(
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+            },
+            # All requests go to one host, so the per-host cap is what bounds
+            # fan-outs like list_all_device_routes.
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=32, ttl_dns_cache=300,
+                                           keepalive_timeout=75),
+        )
+    
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+    
+    async def __aenter__(self) -> "AsyncTailscaleClient":
+        if self.session is None:
+            self._open()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    async def _request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+        """Make an HTTP request to the Tailscale API."""
+        if self.session is None:
+            raise TspyError("Client session is not open; use AsyncTailscaleClient.create() or async with")
+        url = f"{self.base_url}{endpoint}"
+        if params:
+            kwargs['params'] = params
+        
+        try:
+            async with self.session.request(method, url, **kwargs) as response:
+                content = await response.read()
+                if response.status >= 400:
+                    error_data = None
+                    try:
+                        error_data = _loads(content)
+                    except Exception:
+                        pass
+                    
+                    raise TspyAPIError(
+                        f"API request failed: {response.status} {response.reason} for url: {url}",
+                        status_code=response.status,
+                        response_data=error_data
+                    )
+                
+                if content:
+                    return _loads(content)
+                return None
+        
+        except aiohttp.ClientError as e:
+            raise TspyAPIError(f"Request failed: {e}")
+    
+    # Device endpoints
+    async def list_devices(self, fields: Optional[Literal["all", "default"]] = "all") -> List[Device]:
+        """List all devices in the tailnet.
+        
+        Args:
+            fields: Control which fields are returned. "all" returns all fields,
+                   "default" returns a limited set. If not specified, default is used.
+        """
+        params = {"fields": fields} if fields else None
+        data = await self._request("GET", f"{self._tailnet_path}/devices", params=params)
+        return _DEVICE_LIST.validate_python(data.get("devices") or [])
+    
+    async def get_device(self, device_id: str, fields: Optional[Literal["all", "default"]] = "all") -> Device:
+        """Get details of a specific device.
+        
+        Args:
+            device_id: ID of the device (nodeId preferred, numeric id also works)
+            fields: Control which fields are returned
+        """
+        params = {"fields": fields} if fields else None
+        data = await self._request("GET", f"/device/{device_id}", params=params)
+        return Device(**data)
+    
+    async def delete_device(self, device_id: str) -> None:
+        """Delete a device from the tailnet."""
+        await self._request("DELETE", f"/device/{device_id}")
+    
+    async def delete_devices(self, device_ids: List[str]) -> None:
+        """Delete several devices concurrently (see delete_device)."""
+        await asyncio.gather(*(self.delete_device(id_) for id_ in device_ids))
+    
+    async def authorize_device(self, device_id: str, authorized: bool = True) -> None:
+        """Authorize or deauthorize a device."""
+        await self._request("POST", f"/device/{device_id}/authorized", json={"authorized": authorized})
+    
+    async def update_device_tags(self, device_id: str, tags: List[str]) -> None:
+        """Update tags for a device."""
+        await self._request("POST", f"/device/{device_id}/tags", json={"tags": tags})
+    
+    async def expire_device_key(self, device_id: str) -> None:
+        """Mark a device's node key as expired, requiring re-authentication."""
+        await self._request("POST", f"/device/{device_id}/expire")
+    
+    async def get_device_routes(self, device_id: str) -> Dict[str, Any]:
+        """Get the list of subnet routes for a device."""
+        return await self._request("GET", f"/device/{device_id}/routes")
+    
+    async def list_all_device_routes(self, device_ids: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Get the subnet routes of many devices concurrently.
+        
+        Args:
+            device_ids: Devices to look up (default: every device in the tailnet)
+        
+        Returns:
+            A mapping of device ID to that device's routes
+        """
+        if device_ids is None:
+            device_ids = [device.id for device in await self.list_devices(fields="default")]
+        routes = await asyncio.gather(*(self.get_device_routes(device_id) for device_id in device_ids))
+        return dict(zip(device_ids, routes))
+    
+    async def set_device_routes(self, device_id: str, routes: List[str]) -> Dict[str, Any]:
+        """Set enabled subnet routes for a device."""
+        return await self._request("POST", f"/device/{device_id}/routes", json={"routes": routes})
+    
+    async def set_device_name(self, device_id: str, name: str) -> None:
+        """Set device name. Can be FQDN or just the base name."""
+        await self._request("POST", f"/device/{device_id}/name", json={"name": name})
+    
+    async def update_device_key(self, device_id: str, key_expiry_disabled: bool) -> None:
+        """Enable or disable key expiry for a device."""
+        await self._request("POST", f"/device/{device_id}/key", json={"keyExpiryDisabled": key_expiry_disabled})
+    
+    async def set_device_ipv4(self, device_id: str, ipv4: str) -> None:
+        """Set a specific IPv4 address for a device. This will break existing connections."""
+        await self._request("POST", f"/device/{device_id}/ip", json={"ipv4": ipv4})
+    
+    async def get_device_attributes(self, device_id: str) -> Dict[str, Any]:
+        """Get all posture attributes for a device."""
+        return await self._request("GET", f"/device/{device_id}/attributes")
+    
+    async def set_device_attribute(self, device_id: str, attribute_key: str, value: Any, 
+                           expiry: Optional[str] = None, comment: Optional[str] = None) -> Dict[str, Any]:
+        """Set a custom posture attribute on a device. Key must be prefixed with 'custom:'."""
+        body = {"value": value}
+        if expiry:
+            body["expiry"] = expiry
+        if comment:
+            body["comment"] = comment
+        return await self._request("POST", f"/device/{device_id}/attributes/{attribute_key}", json=body)
+    
+    async def delete_device_attribute(self, device_id: str, attribute_key: str) -> None:
+        """Delete a custom posture attribute from a device."""
+        await self._request("DELETE", f"/device/{device_id}/attributes/{attribute_key}")
+    
+    # Device invites
+    async def list_device_invites(self, device_id: str) -> List[Dict[str, Any]]:
+        """List all share invites for a device."""
+        data = await self._request("GET", f"/device/{device_id}/device-invites")
+        return data.get("invites", [])
+    
+    async def create_device_invite(self, device_id: str, multiUse: bool = False, 
+                           allowExitNode: bool = False, email: Optional[str] = None) -> Dict[str, Any]:
+        """Create a device share invite."""
+        body: Dict[str, Any] = {"multiUse": multiUse, "allowExitNode": allowExitNode}
+        if email:
+            body["email"] = email
+        return await self._request("POST", f"/device/{device_id}/device-invites", json=body)
+    
+    async def get_device_invite(self, invite_id: str) -> Dict[str, Any]:
+        """Get details of a device invite."""
+        return await self._request("GET", f"/device-invites/{invite_id}")
+    
+    async def delete_device_invite(self, invite_id: str) -> None:
+        """Delete a device invite."""
+        await self._request("DELETE", f"/device-invites/{invite_id}")
+    
+    async def resend_device_invite(self, invite_id: str) -> None:
+        """Resend a device invite email."""
+        await self._request("POST", f"/device-invites/{invite_id}/resend")
+    
+    async def accept_device_invite(self, code: str) -> None:
+        """Accept a device share invite."""
+        await self._request("POST", "/device-invites/-/accept", json={"code": code})
+    
+    # User endpoints
+    async def list_users(self) -> List[User]:
+        """List all users in the tailnet."""
+        data = await self._request("GET", f"{self._tailnet_path}/users")
+        return _USER_LIST.validate_python(data.get("users") or [])
+    
+    async def get_user(self, user_id: str) -> User:
+        """Get details of a specific user."""
+        data = await self._request("GET", f"{self._tailnet_path}/users/{user_id}")
+        return User(**data)
+    
+    async def delete_user(self, user_id: str) -> None:
+        """Delete a user from the tailnet."""
+        await self._request("DELETE", f"{self._tailnet_path}/users/{user_id}")
+    
+    async def delete_users(self, user_ids: List[str]) -> None:
+        """Delete several users concurrently (see delete_user)."""
+        await asyncio.gather(*(self.delete_user(id_) for id_ in user_ids))
+    
+    async def approve_user(self, user_id: str) -> None:
+        """Approve a user."""
+        await self._request("POST", f"/users/{user_id}/approve")
+    
+    async def suspend_user(self, user_id: str) -> None:
+        """Suspend a user."""
+        await self._request("POST", f"/users/{user_id}/suspend")
+    
+    async def restore_user(self, user_id: str) -> None:
+        """Restore a suspended user."""
+        await self._request("POST", f"/users/{user_id}/restore")
+    
+    async def delete_user_v2(self, user_id: str) -> None:
+        """Delete a user (v2 endpoint)."""
+        await self._request("POST", f"/users/{user_id}/delete")
+    
+    async def set_user_role(self, user_id: str, role: str) -> None:
+        """Set user role. Valid roles: member, admin, billing, auditor, it-admin"""
+        await self._request("POST", f"/users/{user_id}/role", json={"role": role})
+    
+    # User invites
+    async def list_user_invites(self) -> List[UserInvite]:
+        """List all user invites."""
+        data = await self._request("GET", f"{self._tailnet_path}/user-invites")
+        invites = data.get("invites") if data else None
+        return _USER_INVITE_LIST.validate_python(invites or [])
+    
+    async def create_user_invite(self, email: str, role: str = "member") -> Dict[str, Any]:
+        """Create a user invite."""
+        return await self._request("POST", f"{self._tailnet_path}/user-invites", json={"email": email, "role": role})
+    
+    async def get_user_invite(self, invite_id: str) -> Dict[str, Any]:
+        """Get details of a user invite."""
+        return await self._request("GET", f"/user-invites/{invite_id}")
+    
+    async def delete_user_invite(self, invite_id: str) -> None:
+        """Delete a user invite."""
+        await self._request("DELETE", f"/user-invites/{invite_id}")
+    
+    async def resend_user_invite(self, invite_id: str) -> None:
+        """Resend a user invite email."""
+        await self._request("POST", f"/user-invites/{invite_id}/resend")
+    
+    # ACL endpoints
+    async def get_acl(self) -> ACL:
+        """Get the current ACL configuration."""
+        data = await self._request("GET", f"{self._tailnet_path}/acl")
+        return ACL(**data)
+    
+    async def update_acl(self, acl: Dict[str, Any], if_unmodified_since: Optional[str] = None) -> ACL:
+        """Update the ACL configuration."""
+        headers = {"If-Unmodified-Since": if_unmodified_since} if if_unmodified_since else None
+        data = await self._request("POST", f"{self._tailnet_path}/acl", json=acl, headers=headers)
+        return ACL(**data)
+    
+    async def preview_acl(self, acl: Dict[str, Any]) -> Dict[str, Any]:
+        """Preview ACL changes without applying them."""
+        return await self._request("POST", f"{self._tailnet_path}/acl/preview", json=acl)
+    
+    async def validate_acl(self, acl: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate an ACL configuration without applying it."""
+        return await self._request("POST", f"{self._tailnet_path}/acl/validate", json=acl)
+    
+    # DNS endpoints
+    async def get_dns_config(self) -> DNSConfig:
+        """Get the current DNS configuration."""
+        data = await self._request("GET", f"{self._tailnet_path}/dns/preferences")
+        return DNSConfig(**data)
+    
+    async def update_dns_config(self, config: Dict[str, Any]) -> DNSConfig:
+        """Update the DNS configuration."""
+        data = await self._request("POST", f"{self._tailnet_path}/dns/preferences", json=config)
+        return DNSConfig(**data)
+    
+    async def get_nameservers(self) -> List[str]:
+        """Get the list of DNS nameservers."""
+        data = await self._request("GET", f"{self._tailnet_path}/dns/nameservers")
+        return data.get("dns", [])
+    
+    async def set_nameservers(self, nameservers: List[str]) -> None:
+        """Set the DNS nameservers."""
+        await self._request("POST", f"{self._tailnet_path}/dns/nameservers", json={"dns": nameservers})
+    
+    async def get_searchpaths(self) -> List[str]:
+        """Get the list of DNS search paths."""
+        data = await self._request("GET", f"{self._tailnet_path}/dns/searchpaths")
+        return data.get("searchPaths", [])
+    
+    async def set_searchpaths(self, searchpaths: List[str]) -> None:
+        """Set the DNS search paths."""
+        await self._request("POST", f"{self._tailnet_path}/dns/searchpaths", json={"searchPaths": searchpaths})
+    
+    async def get_split_dns(self) -> Dict[str, Any]:
+        """Get split DNS configuration."""
+        return await self._request("GET", f"{self._tailnet_path}/dns/split-dns")
+    
+    async def update_split_dns(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Update split DNS configuration."""
+        return await self._request("PATCH", f"{self._tailnet_path}/dns/split-dns", json=config)
+    
+    # Key endpoints
+    async def list_api_keys(self) -> List[ApiKey]:
+        """List all API keys for the tailnet."""
+        data = await self._request("GET", f"{self._tailnet_path}/keys")
+        return _KEY_LIST.validate_python(data.get("keys") or [])
+    
+    async def create_api_key(self, capabilities: Dict[str, Any], expiry_seconds: int = 90 * 24 * 60 * 60,
+                      description: Optional[str] = None) -> Dict[str, Any]:
+        """Create a new API key."""
+        body = {"capabilities": capabilities, "expirySeconds": expiry_seconds}
+        if description:
+            body["description"] = description
+        return await self._request("POST", f"{self._tailnet_path}/keys", json=body)
+    
+    async def get_api_key(self, key_id: str) -> Dict[str, Any]:
+        """Get details of an API key."""
+        return await self._request("GET", f"{self._tailnet_path}/keys/{key_id}")
+    
+    async def delete_api_key(self, key_id: str) -> None:
+        """Delete an API key."""
+        await self._request("DELETE", f"{self._tailnet_path}/keys/{key_id}")
+    
+    async def delete_api_keys(self, key_ids: List[str]) -> None:
+        """Delete several API keys concurrently (see delete_api_key)."""
+        await asyncio.gather(*(self.delete_api_key(id_) for id_ in key_ids))
+    
+    # Auth keys
+    async def list_auth_keys(self) -> List[Dict[str, Any]]:
+        """List all auth keys for the tailnet."""
+        data = await self._request("GET", f"{self._tailnet_path}/keys")
+        return data.get("keys", [])
+    
+    async def create_auth_key(self, ephemeral: bool = False, reusable: bool = False, 
+                       expiry_seconds: int = 90 * 24 * 60 * 60, 
+                       description: Optional[str] = None,
+                       tags: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Create a new auth key."""
+        body = {
+            "capabilities": {
+                "devices": {
+                    "create": {
+                        "ephemeral": ephemeral,
+                        "reusable": reusable,
+                        "tags": tags or []
+                    }
+                }
+            },
+            "expirySeconds": expiry_seconds
+        }
+        if description:
+            body["description"] = description
+        return await self._request("POST", f"{self._tailnet_path}/keys", json=body)
+    
+    # Logging endpoints
+    async def get_configuration_audit_logs(self, start: str, end: Optional[str] = None,
+                                    actor: Optional[str] = None, target: Optional[str] = None,
+                                    event: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get configuration audit logs.
+        
+        Args:
+            start: Start time in RFC 3339 format (required)
+            end: End time in RFC 3339 format
+            actor: Filter by actor
+            target: Filter by target
+            event: Filter by event type
+        """
+        params = {"start": start}
+        if end:
+            params["end"] = end
+        if actor:
+            params["actor"] = actor
+        if target:
+            params["target"] = target
+        if event:
+            params["event"] = event
+        data = await self._request("GET", f"{self._tailnet_path}/logging/configuration", params=params)
+        logs = data.get("logs") if data else None
+        return logs if logs is not None else []
+    
+    
+    async def get_network_logs(self, start: Optional[str] = None, end: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get network logs."""
+        params = {}
+        if start:
+            params["start"] = start
+        if end:
+            params["end"] = end
+        data = await self._request("GET", f"{self._tailnet_path}/logging/network", params=params)
+        return data.get("logs", [])
+    
+    async def get_log_stream_status(self, log_type: str) -> Dict[str, Any]:
+        """Get log streaming status. Log types: configuration, network, audit"""
+        return await self._request("GET", f"{self._tailnet_path}/logging/{log_type}/stream/status")
+    
+    async def set_log_stream(self, log_type: str, destination: str, enabled: bool = True) -> None:
+        """Configure log streaming. Log types: configuration, network, audit"""
+        body = {"destination": destination, "enabled": enabled}
+        await self._request("POST", f"{self._tailnet_path}/logging/{log_type}/stream", json=body)
+    
+    async def delete_log_stream(self, log_type: str) -> None:
+        """Delete log streaming configuration."""
+        await self._request("DELETE", f"{self._tailnet_path}/logging/{log_type}/stream")
+    
+    # Contacts endpoints
+    async def get_contacts(self) -> Dict[str, Any]:
+        """Get contact preferences."""
+        return await self._request("GET", f"{self._tailnet_path}/contacts")
+    
+    async def update_contact(self, contact_type: str, email: str) -> Dict[str, Any]:
+        """Update contact email. Contact types: security, support, billing"""
+        return await self._request("PATCH", f"{self._tailnet_path}/contacts/{contact_type}", 
+                           json={"email": email})
+    
+    async def resend_contact_verification(self, contact_type: str) -> None:
+        """Resend contact verification email."""
+        await self._request("POST", f"{self._tailnet_path}/contacts/{contact_type}/resend-verification-email")
+    
+    # Webhook endpoints
+    async def list_webhooks(self) -> List[Webhook]:
+        """List all webhook endpoints."""
+        data = await self._request("GET", f"{self._tailnet_path}/webhooks")
+        webhooks = data.get("webhooks") if data else None
+        return _WEBHOOK_LIST.validate_python(webhooks or [])
+    
+    async def create_webhook(self, endpoint_url: str, provider_type: str = "generic",
+                      subscriptions: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Create a webhook endpoint."""
+        body: Dict[str, Any] = {"endpointUrl": endpoint_url, "providerType": provider_type}
+        if subscriptions:
+            body["subscriptions"] = subscriptions
+        return await self._request("POST", f"{self._tailnet_path}/webhooks", json=body)
+    
+    async def get_webhook(self, endpoint_id: str) -> Dict[str, Any]:
+        """Get webhook endpoint details."""
+        return await self._request("GET", f"/webhooks/{endpoint_id}")
+    
+    async def update_webhook(self, endpoint_id: str, subscriptions: List[str]) -> Dict[str, Any]:
+        """Update webhook subscriptions."""
+        return await self._request("PATCH", f"/webhooks/{endpoint_id}", 
+                           json={"subscriptions": subscriptions})
+    
+    async def delete_webhook(self, endpoint_id: str) -> None:
+        """Delete a webhook endpoint."""
+        await self._request("DELETE", f"/webhooks/{endpoint_id}")
+    
+    async def delete_webhooks(self, endpoint_ids: List[str]) -> None:
+        """Delete several webhook endpoints concurrently (see delete_webhook)."""
+        await asyncio.gather(*(self.delete_webhook(id_) for id_ in endpoint_ids))
+    
+    async def test_webhook(self, endpoint_id: str) -> None:
+        """Send a test event to webhook endpoint."""
+        await self._request("POST", f"/webhooks/{endpoint_id}/test")
+    
+    async def rotate_webhook_secret(self, endpoint_id: str) -> Dict[str, Any]:
+        """Rotate webhook signing secret."""
+        return await self._request("POST", f"/webhooks/{endpoint_id}/rotate")
+    
+    # Tailnet settings
+    async def get_tailnet_settings(self) -> Dict[str, Any]:
+        """Get tailnet settings."""
+        return await self._request("GET", f"{self._tailnet_path}/settings")
+    
+    async def update_tailnet_settings(self, settings: Dict[str, Any]) -> Dict[str, Any]:
+        """Update tailnet settings."""
+        return await self._request("PATCH", f"{self._tailnet_path}/settings", json=settings)
+    
+    # Device posture integrations
+    async def list_posture_integrations(self) -> List[PostureIntegration]:
+        """List device posture integrations."""
+        data = await self._request("GET", f"{self._tailnet_path}/posture/integrations")
+        return _POSTURE_INTEGRATION_LIST.validate_python(data.get("integrations") or [])
+    
+    async def create_posture_integration(self, provider: str, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a device posture integration."""
+        return await self._request("POST", f"{self._tailnet_path}/posture/integrations",
+                           json={"provider": provider, "config": config})
+    
+    async def get_posture_integration(self, integration_id: str) -> Dict[str, Any]:
+        """Get device posture integration details."""
+        return await self._request("GET", f"{self._tailnet_path}/posture/integrations/{integration_id}")
+    
+    async def update_posture_integration(self, integration_id: str, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Update device posture integration."""
+        return await self._request("PATCH", f"{self._tailnet_path}/posture/integrations/{integration_id}",
+                           json={"config": config})
+    
+    async def delete_posture_integration(self, integration_id: str) -> None:
+        """Delete device posture integration."""
+        await self._request("DELETE", f"{self._tailnet_path}/posture/integrations/{integration_id}")
\ No newline at end of file
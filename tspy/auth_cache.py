@@ -0,0 +1,88 @@
+"""OAuth access-token exchange with an optional on-disk token cache."""
+
+import hashlib
+import os
+import time
+from typing import List, Optional
+
+import requests
+
+try:
+    import diskcache  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - optional dependency
+    diskcache = None
+
+from .cache import DEFAULT_CACHE_DIR
+from .exceptions import TspyError, TspyAPIError
+
+# Treat cached tokens as expired this many seconds early so a token is never
+# handed out moments before the server starts rejecting it.
+EXPIRY_MARGIN = 60
+
+# Seconds to wait on the token endpoint before giving up.
+TOKEN_TIMEOUT = 30
+
+
+class TokenCache:
+    """Disk-backed store of OAuth access tokens and their expiry times.
+
+    Tokens are keyed by a hash of the OAuth client credentials, requested scopes
+    and API base URL, and the cache directory is created private to the user.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        if diskcache is None:
+            raise TspyError("Token caching requires diskcache: pip install tspy[cache]")
+        path = os.path.join(os.path.expanduser(directory or DEFAULT_CACHE_DIR), "tokens")
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        self._cache = diskcache.Cache(path)
+
+    @staticmethod
+    def key(client_id: str, client_secret: str, scopes: Optional[List[str]], base_url: str) -> str:
+        """Build the cache key for a set of OAuth client credentials."""
+        material = "\0".join([client_id, client_secret, " ".join(sorted(scopes or [])), base_url])
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached token that is still valid, if any."""
+        entry = self._cache.get(key)
+        if entry is not None and entry["exp"] - EXPIRY_MARGIN > time.time():
+            return entry["token"]
+        return None
+
+    def set(self, key: str, token: str, expires_in: int) -> None:
+        """Store ``token``, which the server said expires in ``expires_in`` seconds."""
+        self._cache.set(key, {"token": token, "exp": time.time() + expires_in}, expire=expires_in)
+
+
+def get_oauth_token(client_id: str, client_secret: str, base_url: str,
+                    scopes: Optional[List[str]] = None, cache: Optional[TokenCache] = None) -> str:
+    """Exchange OAuth client credentials for an access token.
+
+    When ``cache`` is given, an unexpired token from a previous exchange is
+    reused instead of making a network round-trip, and fresh tokens are written
+    back to it.
+    """
+    key = TokenCache.key(client_id, client_secret, scopes, base_url)
+    if cache is not None:
+        token = cache.get(key)
+        if token is not None:
+            return token
+
+    data = {"client_id": client_id, "client_secret": client_secret}
+    if scopes:
+        data["scope"] = " ".join(scopes)
+    try:
+        response = requests.post(f"{base_url}/oauth/token", data=data, timeout=TOKEN_TIMEOUT)
+        response.raise_for_status()
+        body = response.json()
+    except requests.exceptions.HTTPError as e:
+        status_code = e.response.status_code if e.response is not None else None
+        raise TspyAPIError(f"OAuth token exchange failed: {e}", status_code=status_code)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        raise TspyAPIError(f"OAuth token exchange failed: {e}")
+
+    token = body["access_token"]
+    if cache is not None:
+        cache.set(key, token, int(body.get("expires_in", 3600)))
+    return token
@@ -0,0 +1,115 @@
+"""On-disk cache for idempotent GET responses."""
+
+import hashlib
+import os
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+try:
+    import diskcache  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - optional dependency
+    diskcache = None
+
+from .exceptions import TspyError
+
+DEFAULT_CACHE_DIR = os.path.join("~", ".cache", "tspy")
+
+# How long (in seconds) a failed GET is remembered, by status code. Missing or
+# forbidden resources rarely appear between runs; server errors clear quickly.
+NEGATIVE_TTLS = {403: 300, 404: 300}
+SERVER_ERROR_TTL = 30
+
+# How long (in seconds) a response is kept after going stale, for revalidation.
+# Past that it is evicted, so namespaces of expired OAuth tokens don't pile up.
+STALE_TTL = 24 * 60 * 60
+
+_ERROR_SUFFIX = "#error"
+
+
+def negative_ttl(status_code: Optional[int]) -> Optional[int]:
+    """Return how long a failure with ``status_code`` may be cached, if at all."""
+    if status_code is None:
+        return None
+    if status_code >= 500:
+        return SERVER_ERROR_TTL
+    return NEGATIVE_TTLS.get(status_code)
+
+
+class ResponseCache:
+    """Disk-backed store of GET response bodies keyed by canonical URL.
+
+    Entries keep the response's ``ETag``/``Last-Modified`` validators, so once an
+    entry is older than ``ttl`` it can be revalidated with a conditional request
+    rather than downloaded again. Keys are namespaced by a hash of the API key so
+    clients using different credentials never share entries.
+    """
+
+    def __init__(self, api_key: str, ttl: int, directory: Optional[str] = None):
+        if diskcache is None:
+            raise TspyError("Response caching requires diskcache: pip install tspy[cache]")
+        self.ttl = ttl
+        self.namespace = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        # Cached bodies include device inventories, user emails and ACLs, so the
+        # directory is created private to the user, as TokenCache does.
+        path = os.path.expanduser(directory or DEFAULT_CACHE_DIR)
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        self._cache = diskcache.Cache(path)
+
+    def key(self, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the cache key for a GET of ``url`` with ``params``."""
+        query = urlencode(sorted(params.items())) if params else ""
+        return f"{self.namespace}|{url}?{query}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored entry for ``key``, fresh or stale, if any."""
+        return self._cache.get(key)
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Whether ``entry`` can be served without contacting the server."""
+        return time.time() - entry["stored"] < self.ttl
+
+    def validators(self, entry: Dict[str, Any]) -> Dict[str, str]:
+        """Conditional request headers for revalidating ``entry``."""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def set(self, key: str, content: bytes, headers: Any) -> None:
+        """Store a response body along with its validators."""
+        self._cache.set(key, {
+            "content": content,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "stored": time.time(),
+        }, expire=self.ttl + STALE_TTL)
+
+    def touch(self, key: str, entry: Dict[str, Any]) -> None:
+        """Mark a revalidated (HTTP 304) entry as fresh again."""
+        self._cache.set(key, dict(entry, stored=time.time()), expire=self.ttl + STALE_TTL)
+
+    def get_error(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a remembered failure for ``key`` that has not yet expired."""
+        return self._cache.get(key + _ERROR_SUFFIX)
+
+    def set_error(self, key: str, message: str, status_code: Optional[int],
+                  response_data: Optional[dict]) -> None:
+        """Remember a failed GET so repeats within its TTL skip the network."""
+        ttl = negative_ttl(status_code)
+        if ttl is None:
+            return
+        self._cache.set(key + _ERROR_SUFFIX, {
+            "message": message,
+            "status_code": status_code,
+            "response_data": response_data,
+        }, expire=ttl)
+
+    def clear(self, negative_only: bool = False) -> None:
+        """Drop every entry belonging to this namespace, or only remembered failures."""
+        prefix = f"{self.namespace}|"
+        for key in list(self._cache.iterkeys()):
+            if key.startswith(prefix) and (not negative_only or key.endswith(_ERROR_SUFFIX)):
+                self._cache.delete(key)
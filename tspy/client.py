@@ -1,17 +1,114 @@
 """Comprehensive Tailscale API v2 client implementation."""
 
-from typing import Any, Dict, List, Optional, Literal
+import copy
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Literal, Tuple, Type, Union
+from urllib.parse import quote
+
 import requests
-from requests.auth import HTTPBasicAuth
+from pydantic import BaseModel, Field, TypeAdapter, create_model
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - optional dependency
+    from json import loads as _loads  # type: ignore[assignment]
+
+try:
+    import ijson  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+from .models import (
+    Device, DeviceBundle, User, UserInvite, ACL, DNSConfig, ApiKey, Webhook, PostureIntegration
+)
+from .auth_cache import TokenCache, get_oauth_token
+from .cache import ResponseCache
+from .exceptions import TspyError, TspyAPIError
+
+try:
+    import msgspec
+    from . import fastmodels
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = fastmodels = None  # type: ignore[assignment]
+
+
+def _page_model(key: str, item_type: Any) -> Type[BaseModel]:
+    """Build the envelope model for one page of a list endpoint.
+    
+    Validating response bytes against it lets pydantic-core parse the JSON
+    straight into typed items without building intermediate dicts.
+    """
+    return create_model(
+        f"_{key.title()}Page",
+        items=(Optional[List[item_type]], Field(None, alias=key)),
+        next_cursor=(Optional[str], Field(None, alias="nextCursor")),
+    )
+
+
+_DEVICE_PAGE = _page_model("devices", Device)
+_USER_PAGE = _page_model("users", User)
+_USER_INVITE_PAGE = _page_model("invites", UserInvite)
+_KEY_PAGE = _page_model("keys", ApiKey)
+_KEY_DICT_PAGE = _page_model("keys", Dict[str, Any])
+_API_KEY_LIST = TypeAdapter(List[ApiKey])
+_WEBHOOK_PAGE = _page_model("webhooks", Webhook)
+_POSTURE_INTEGRATION_PAGE = _page_model("integrations", PostureIntegration)
+
+
+@functools.lru_cache(maxsize=None)
+def _fast_page_decoder(key: str, item_type: str) -> Callable[[bytes], Any]:
+    """Return the msgspec page decoder for ``fastmodels.<item_type>`` items under ``key``."""
+    if fastmodels is None:
+        raise TspyError("Fast decoding requires msgspec: pip install tspy[msgspec]")
+    decode = fastmodels.page_decoder(key, getattr(fastmodels, item_type))
+    
+    def decode_page(content: bytes) -> Any:
+        try:
+            return decode(content)
+        except msgspec.DecodeError as e:
+            raise TspyError(f"Failed to decode {key} page: {e}") from e
+    return decode_page
 
-from .models import Device, User, ACL, DNSConfig
-from .exceptions import TspyAPIError
+# Most memoized device lookups kept at once (see device_cache_ttl).
+_DEVICE_MEMO_SIZE = 256
+
+# Bytes read off a streamed response per ijson feed.
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# How long (in seconds) one keys listing answers list_api_keys/list_auth_keys.
+_KEYS_TTL = 2.0
+
+# Request bodies that never change, serialized once instead of on every call.
+_AUTHORIZED_BODY = b'{"authorized":true}'
+_UNAUTHORIZED_BODY = b'{"authorized":false}'
+
+# Per-device sub-resources get_devices_with_details can fetch, by DeviceBundle
+# field, mapped to the client method that fetches them.
+_DEVICE_DETAILS = {
+    "routes": "get_device_routes",
+    "attributes": "get_device_attributes",
+    "invites": "list_device_invites",
+}
 
 
 class TailscaleClient:
     """Client for interacting with the Tailscale API v2."""
     
-    def __init__(self, api_key: str, tailnet: str = "-", base_url: str = "https://api.tailscale.com/api/v2"):
+    def __init__(self, api_key: str, tailnet: str = "-", base_url: str = "https://api.tailscale.com/api/v2",
+                 cache_ttl: Optional[int] = None, cache_dir: Optional[str] = None, http2: bool = False,
+                 pool_maxsize: int = 32, device_cache_ttl: Optional[float] = None):
         """
         Initialize the Tailscale client.
         
@@ -19,45 +116,351 @@ class TailscaleClient:
             api_key: Your Tailscale API key
             tailnet: Your tailnet name (default: "-" for the default tailnet)
             base_url: Base URL for the API (default: https://api.tailscale.com/api/v2)
+            cache_ttl: If set, cache GET responses on disk for this many seconds
+                      (requires diskcache). Stale entries are revalidated with
+                      If-None-Match/If-Modified-Since before being re-downloaded.
+                      403/404 failures are remembered for 5 minutes and 5xx
+                      failures for 30 seconds. Any write made through the
+                      client drops the whole cache.
+            cache_dir: Directory for the response cache (default: ~/.cache/tspy)
+            http2: Send requests through an HTTP/2 httpx client (requires httpx[http2])
+                  so concurrent calls share one multiplexed connection
+            pool_maxsize: Connections kept alive for reuse; raise it to at least
+                         the number of threads sharing this client
+            device_cache_ttl: If set, answer repeated get_device, get_device_routes
+                             and get_device_attributes calls from memory for this
+                             many seconds; any request that modifies a device
+                             forgets them early
         """
         self.api_key = api_key
         self.tailnet = tailnet
         self.base_url = base_url.rstrip("/")
-        self.session = requests.Session()
-        self.session.auth = HTTPBasicAuth(api_key, "")
-        self.session.headers.update({
+        # Built once so endpoint methods don't re-quote the tailnet, re-join the
+        # base URL or re-encode credentials (as per-request HTTPBasicAuth would)
+        # on every call.
+        self._tailnet_url = f"{self.base_url}/tailnet/{quote(tailnet, safe='')}"
+        self._device_url = f"{self.base_url}/device"
+        self._device_invites_url = f"{self.base_url}/device-invites"
+        self._users_url = f"{self.base_url}/users"
+        self._user_invites_url = f"{self.base_url}/user-invites"
+        self._webhooks_url = f"{self.base_url}/webhooks"
+        self._keys_url = f"{self._tailnet_url}/keys"
+        headers = {
+            "Authorization": f"Bearer {api_key}",
             "Accept": "application/json",
+            # gzip/deflate, plus br when brotli is installed (tspy[compress]);
+            # only encodings the installed decoders can undo are advertised.
+            "Accept-Encoding": DEFAULT_ACCEPT_ENCODING,
             "Content-Type": "application/json",
-        })
-    
-    def _request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
-        """Make an HTTP request to the Tailscale API."""
-        url = f"{self.base_url}{endpoint}"
-        if params:
-            kwargs['params'] = params
+        }
+        self._http2 = http2
+        self.session: Union[requests.Session, "httpx.Client"]
+        # (status error, transport error) exception types of the active backend.
+        self._http_errors: Tuple[Type[Union[requests.exceptions.HTTPError, "httpx.HTTPStatusError"]],
+                                 Type[Exception]]
+        if http2:
+            if httpx is None:
+                raise TspyError("HTTP/2 support requires httpx: pip install tspy[http2]")
+            self.session = httpx.Client(headers=headers, transport=httpx.HTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize),
+            ))
+            self._http_errors = (httpx.HTTPStatusError, httpx.HTTPError)
+        else:
+            self.session = requests.Session()
+            self.session.headers.update(headers)
+            # One pooled adapter for the client's lifetime keeps connections to the
+            # API alive across calls (and threads) instead of re-handshaking TLS.
+            # Retries honour Retry-After on 429 and stay limited to urllib3's
+            # idempotent methods, so a POST is never sent twice.
+            adapter = HTTPAdapter(
+                pool_connections=pool_maxsize,
+                pool_maxsize=pool_maxsize,
+                max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+                                  raise_on_status=False),
+            )
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+            self._http_errors = (requests.exceptions.HTTPError, requests.exceptions.RequestException)
+        self._cache = ResponseCache(api_key, cache_ttl, cache_dir) if cache_ttl else None
+        # Opt-in memo of device lookups, keyed by (method name, *args) and holding
+        # (fetched at, result); any request that mutates a device clears it.
+        self._device_cache_ttl = device_cache_ttl
+        self._device_memo: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+        self._device_memo_lock = threading.Lock()
+        # Last ETag and parsed result of each rarely-changing config endpoint, so
+        # unchanged resources come back as a bodyless 304 and skip parsing.
+        self._etag_cache: Dict[str, Tuple[str, Any]] = {}
+        self._etag_lock = threading.Lock()
+        # API and auth keys are listed by the same endpoint; one listing serves
+        # both list_api_keys and list_auth_keys for _KEYS_TTL seconds.
+        # Writes bump _keys_version so a listing that started before one is
+        # never stored afterwards.
+        self._keys: Optional[List[Dict[str, Any]]] = None
+        self._keys_fetched = 0.0
+        self._keys_version = 0
+        self._keys_lock = threading.Lock()
+    
+    @classmethod
+    def from_oauth(cls, client_id: str, client_secret: str, tailnet: str = "-",
+                   base_url: str = "https://api.tailscale.com/api/v2", scopes: Optional[List[str]] = None,
+                   cache_token: bool = False, **kwargs) -> "TailscaleClient":
+        """
+        Create a client authenticated with an OAuth client's access token.
+        
+        Args:
+            client_id: OAuth client ID
+            client_secret: OAuth client secret
+            tailnet: Your tailnet name (default: "-" for the default tailnet)
+            base_url: Base URL for the API (default: https://api.tailscale.com/api/v2)
+            scopes: Scopes to request (default: all scopes granted to the client)
+            cache_token: Reuse an unexpired token from a previous run, stored on
+                        disk under cache_dir (requires diskcache)
+            **kwargs: Passed through to TailscaleClient()
         
+        Access tokens expire after an hour; create a new client to refresh.
+        """
+        cache = TokenCache(kwargs.get("cache_dir")) if cache_token else None
+        token = get_oauth_token(client_id, client_secret, base_url.rstrip("/"), scopes=scopes, cache=cache)
+        return cls(api_key=token, tailnet=tailnet, base_url=base_url, **kwargs)
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self.session.close()
+    
+    def __enter__(self) -> "TailscaleClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _send(self, method: str, url: str, **kwargs) -> Any:
+        """Send an HTTP request, raising TspyAPIError on failure."""
+        status_error, transport_error = self._http_errors
+        if self._http2 and "data" in kwargs:
+            # Pre-serialized bodies are passed as data=; httpx calls that content=.
+            kwargs["content"] = kwargs.pop("data")
+        response: Union[requests.Response, "httpx.Response"]
         try:
-            response = self.session.request(method, url, **kwargs)
-            response.raise_for_status()
-            
-            if response.content:
-                return response.json()
-            return None
+            if self._http2 and kwargs.pop("stream", False):
+                # httpx has no stream= argument; send the request unread instead.
+                session = self.session
+                assert isinstance(session, httpx.Client)
+                response = session.send(session.build_request(method, url, **kwargs), stream=True)
+            else:
+                response = self.session.request(method, url, **kwargs)
+            # httpx treats a 304 from a conditional GET as an error; requests doesn't.
+            if response.status_code != 304:
+                response.raise_for_status()
+            return response
             
-        except requests.exceptions.HTTPError as e:
+        except status_error as e:
+            error_response: Any = e.response
             error_data = None
             try:
-                error_data = e.response.json()
+                # read() also loads the body of a streamed httpx response.
+                error_data = _loads(error_response.read() if self._http2 else error_response.content)
             except Exception:
                 pass
             
             raise TspyAPIError(
                 f"API request failed: {e}",
-                status_code=e.response.status_code,
+                status_code=error_response.status_code,
                 response_data=error_data
             )
-        except requests.exceptions.RequestException as e:
+        except transport_error as e:
+            raise TspyAPIError(f"Request failed: {e}")
+    
+    def _request(self, method: str, url: str, **kwargs) -> Any:
+        """Make an HTTP request to an absolute Tailscale API URL."""
+        content = self._fetch(method, url, **kwargs)
+        if content:
+            return _loads(content)
+        return None
+    
+    def _fetch(self, method: str, url: str, **kwargs) -> bytes:
+        """Make an HTTP request to an absolute Tailscale API URL, returning the raw body.
+        
+        ``kwargs`` (params, json, data, headers, ...) go straight to the session.
+        """
+        if self._cache is not None and method == "GET":
+            return self._cached_get(self._cache, url, **kwargs)
+        
+        response = self._send(method, url, **kwargs)
+        if method != "GET":
+            if self._cache is not None:
+                # Writes land on paths (/device/{id}, /users/{id}/...) that the
+                # cached reads (/tailnet/{t}/devices, ...) don't share, so any
+                # write drops every cached response for this API key.
+                self._cache.clear()
+            if url.startswith(f"{self._device_url}/"):
+                self._clear_device_caches()
+            elif url.startswith(self._keys_url):
+                self._forget_keys()
+        return response.content
+    
+    def _cached_get(self, cache: ResponseCache, url: str, **kwargs) -> bytes:
+        """GET ``url`` through the response cache ``cache``, returning the raw body."""
+        key = cache.key(url, kwargs.get("params"))
+        error = cache.get_error(key)
+        if error is not None:
+            raise TspyAPIError(error["message"], status_code=error["status_code"],
+                               response_data=error["response_data"])
+        entry = cache.get(key)
+        if entry is not None and cache.is_fresh(entry):
+            return entry["content"]
+        
+        if entry is not None:
+            kwargs["headers"] = {**cache.validators(entry), **(kwargs.get("headers") or {})}
+        try:
+            response = self._send("GET", url, **kwargs)
+        except TspyAPIError as e:
+            cache.set_error(key, str(e), e.status_code, e.response_data)
+            raise
+        if response.status_code == 304 and entry is not None:
+            cache.touch(key, entry)
+            return entry["content"]
+        cache.set(key, response.content, response.headers)
+        return response.content
+    
+    def _bulk(self, fn: Callable[[str], Any], ids: Iterable[str], max_workers: int) -> None:
+        """Call ``fn`` on every ID concurrently, raising the first failure in ``ids`` order.
+        
+        Every call runs to completion even if an earlier one fails.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for _ in executor.map(fn, ids):
+                pass
+    
+    def _conditional_get(self, url: str, parse: Callable[[bytes], Any]) -> Any:
+        """GET ``url``, reusing the last parsed result while its ETag still matches.
+        
+        Each call returns its own deep copy of the cached result, so callers
+        may modify it freely. With the on-disk response cache enabled,
+        revalidation is left to that cache instead.
+        """
+        if self._cache is not None:
+            return parse(self._fetch("GET", url))
+        
+        with self._etag_lock:
+            cached = self._etag_cache.get(url)
+        kwargs = {"headers": {"If-None-Match": cached[0]}} if cached is not None else {}
+        response = self._send("GET", url, **kwargs)
+        if response.status_code == 304 and cached is not None:
+            return copy.deepcopy(cached[1])
+        
+        result = parse(response.content)
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._etag_lock:
+                self._etag_cache[url] = (etag, result)
+            return copy.deepcopy(result)
+        return result
+    
+    def _iter_items(self, url: str, key: str, **kwargs) -> Iterator[Any]:
+        """Yield the elements of the ``key`` array in a GET response one at a time.
+        
+        With ijson installed the body is parsed incrementally as it arrives, so
+        memory is bounded by a single element; otherwise (or when the response
+        cache is enabled) the whole body is parsed up front.
+        """
+        if ijson is None or self._cache is not None:
+            data = self._request("GET", url, **kwargs)
+            yield from (data.get(key) or []) if data else []
+            return
+        
+        transport_error = self._http_errors[1]
+        response = self._send("GET", url, stream=True, **kwargs)
+        try:
+            if self._http2:
+                chunks = response.iter_bytes()
+            else:
+                response.raw.decode_content = True
+                chunks = iter(functools.partial(response.raw.read, _STREAM_CHUNK_SIZE), b"")
+            # Push decoded chunks into ijson as they come off the stream.
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, f"{key}.item", use_float=True)
+            received = False
+            for chunk in chunks:
+                received = received or bool(chunk)
+                parser.send(chunk)
+                yield from items
+                del items[:]
+            # An empty body (204, or a bare 200) has no items.
+            if received:
+                parser.close()
+                yield from items
+        except ijson.JSONError as e:
+            raise TspyAPIError(f"Invalid JSON in response: {e}", status_code=response.status_code)
+        except transport_error as e:
             raise TspyAPIError(f"Request failed: {e}")
+        finally:
+            response.close()
+    
+    def _paginate(self, url: str, decode: Callable[[bytes], Any], params: Optional[Dict[str, Any]] = None,
+                  page_size: Optional[int] = None) -> Iterator[Any]:
+        """Yield the items across every page of a list endpoint.
+        
+        Follows ``nextCursor`` in the response body while the server returns one;
+        endpoints that answer in a single response yield exactly one page.
+        ``decode`` turns a page's bytes into an object with ``items`` and
+        ``next_cursor`` attributes (a page envelope's model_validate_json).
+        """
+        params = dict(params or {})
+        if page_size:
+            params["limit"] = page_size
+        while True:
+            content = self._fetch("GET", url, params=params)
+            if not content:
+                return
+            page = decode(content)
+            yield from page.items or []
+            if not page.next_cursor:
+                return
+            params = {**params, "cursor": page.next_cursor}
+    
+    def _memoized(self, fetch: Callable[..., Any], *args: Any) -> Any:
+        """Return ``fetch(*args)``, reusing the result for ``device_cache_ttl`` seconds.
+        
+        Callers get their own deep copy, so mutating a result never changes
+        what later calls return.
+        """
+        if not self._device_cache_ttl:
+            return fetch(*args)
+        key = (fetch.__name__, *args)
+        now = time.monotonic()
+        with self._device_memo_lock:
+            entry = self._device_memo.get(key)
+        if entry is None or now - entry[0] >= self._device_cache_ttl:
+            entry = (now, fetch(*args))
+            with self._device_memo_lock:
+                self._device_memo.pop(key, None)
+                if len(self._device_memo) >= _DEVICE_MEMO_SIZE:
+                    # Dicts keep insertion order, so the first entry is the oldest.
+                    del self._device_memo[next(iter(self._device_memo))]
+                self._device_memo[key] = entry
+        return copy.deepcopy(entry[1])
+    
+    def _clear_device_caches(self) -> None:
+        """Forget memoized get_device/get_device_routes/get_device_attributes results."""
+        with self._device_memo_lock:
+            self._device_memo.clear()
+    
+    def clear_cache(self, negative_only: bool = False) -> None:
+        """Drop cached responses for this client's API key.
+        
+        Args:
+            negative_only: Only forget cached failures (404s, 5xx, ...), keeping
+                          successful responses and memoized device lookups
+        """
+        if not negative_only:
+            self._clear_device_caches()
+            with self._etag_lock:
+                self._etag_cache.clear()
+            self._forget_keys()
+        if self._cache is not None:
+            self._cache.clear(negative_only=negative_only)
     
     # Device endpoints
     def list_devices(self, fields: Optional[Literal["all", "default"]] = "all") -> List[Device]:
@@ -67,60 +470,125 @@ class TailscaleClient:
             fields: Control which fields are returned. "all" returns all fields,
                    "default" returns a limited set. If not specified, default is used.
         """
+        return list(self.iter_devices(fields=fields))
+    
+    def iter_devices(self, fields: Optional[Literal["all", "default"]] = "all",
+                     page_size: Optional[int] = None) -> Iterator[Device]:
+        """Iterate over devices in the tailnet, fetching pages lazily.
+        
+        Args:
+            fields: Control which fields are returned (see list_devices)
+            page_size: Maximum number of devices to request per page
+        """
         params = {"fields": fields} if fields else None
-        data = self._request("GET", f"/tailnet/{self.tailnet}/devices", params=params)
-        return [Device(**device) for device in data.get("devices", [])]
+        return self._paginate(f"{self._tailnet_url}/devices", _DEVICE_PAGE.model_validate_json, params, page_size)
     
     def get_device(self, device_id: str, fields: Optional[Literal["all", "default"]] = "all") -> Device:
         """Get details of a specific device.
         
+        With ``device_cache_ttl`` set, results are memoized for that many
+        seconds, or until a request modifies a device; each call returns a
+        fresh copy. Without it every call goes to the API.
+        
         Args:
             device_id: ID of the device (nodeId preferred, numeric id also works)
             fields: Control which fields are returned
         """
-        params = {"fields": fields} if fields else None
-        data = self._request("GET", f"/device/{device_id}", params=params)
-        return Device(**data)
+        return self._memoized(self._get_device, device_id, fields)
+    
+    def _get_device(self, device_id: str, fields: Optional[Literal["all", "default"]]) -> Device:
+        content = self._fetch("GET", f"{self._device_url}/{device_id}", params={"fields": fields} if fields else None)
+        return Device.model_validate_json(content)
     
     def delete_device(self, device_id: str) -> None:
         """Delete a device from the tailnet."""
-        self._request("DELETE", f"/device/{device_id}")
+        self._request("DELETE", f"{self._device_url}/{device_id}")
+    
+    def delete_devices(self, device_ids: Iterable[str], max_workers: int = 16) -> None:
+        """Delete several devices concurrently (see delete_device)."""
+        self._bulk(self.delete_device, device_ids, max_workers)
     
     def authorize_device(self, device_id: str, authorized: bool = True) -> None:
         """Authorize or deauthorize a device."""
-        self._request("POST", f"/device/{device_id}/authorized", json={"authorized": authorized})
+        self._request("POST", f"{self._device_url}/{device_id}/authorized",
+                      data=_AUTHORIZED_BODY if authorized else _UNAUTHORIZED_BODY)
     
     def update_device_tags(self, device_id: str, tags: List[str]) -> None:
         """Update tags for a device."""
-        self._request("POST", f"/device/{device_id}/tags", json={"tags": tags})
+        self._request("POST", f"{self._device_url}/{device_id}/tags", json={"tags": tags})
     
     def expire_device_key(self, device_id: str) -> None:
         """Mark a device's node key as expired, requiring re-authentication."""
-        self._request("POST", f"/device/{device_id}/expire")
+        self._request("POST", f"{self._device_url}/{device_id}/expire")
     
     def get_device_routes(self, device_id: str) -> Dict[str, Any]:
-        """Get the list of subnet routes for a device."""
-        return self._request("GET", f"/device/{device_id}/routes")
+        """Get the list of subnet routes for a device (memoized like get_device)."""
+        return self._memoized(self._get_device_routes, device_id)
+    
+    def _get_device_routes(self, device_id: str) -> Dict[str, Any]:
+        return self._request("GET", f"{self._device_url}/{device_id}/routes")
     
     def set_device_routes(self, device_id: str, routes: List[str]) -> Dict[str, Any]:
         """Set enabled subnet routes for a device."""
-        return self._request("POST", f"/device/{device_id}/routes", json={"routes": routes})
+        return self._request("POST", f"{self._device_url}/{device_id}/routes", json={"routes": routes})
     
     def set_device_name(self, device_id: str, name: str) -> None:
         """Set device name. Can be FQDN or just the base name."""
-        self._request("POST", f"/device/{device_id}/name", json={"name": name})
+        self._request("POST", f"{self._device_url}/{device_id}/name", json={"name": name})
     
     def update_device_key(self, device_id: str, key_expiry_disabled: bool) -> None:
         """Enable or disable key expiry for a device."""
-        self._request("POST", f"/device/{device_id}/key", json={"keyExpiryDisabled": key_expiry_disabled})
+        self._request("POST", f"{self._device_url}/{device_id}/key", json={"keyExpiryDisabled": key_expiry_disabled})
     
     def set_device_ipv4(self, device_id: str, ipv4: str) -> None:
         """Set a specific IPv4 address for a device. This will break existing connections."""
-        self._request("POST", f"/device/{device_id}/ip", json={"ipv4": ipv4})
+        self._request("POST", f"{self._device_url}/{device_id}/ip", json={"ipv4": ipv4})
     
     def get_device_attributes(self, device_id: str) -> Dict[str, Any]:
-        """Get all posture attributes for a device."""
-        return self._request("GET", f"/device/{device_id}/attributes")
+        """Get all posture attributes for a device (memoized like get_device)."""
+        return self._memoized(self._get_device_attributes, device_id)
+    
+    def _get_device_attributes(self, device_id: str) -> Dict[str, Any]:
+        return self._request("GET", f"{self._device_url}/{device_id}/attributes")
+    
+    def get_device_bundle(self, device_id: str) -> DeviceBundle:
+        """Get a device, its routes and its posture attributes in one concurrent round-trip."""
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            device = executor.submit(self.get_device, device_id)
+            routes = executor.submit(self.get_device_routes, device_id)
+            attributes = executor.submit(self.get_device_attributes, device_id)
+            return DeviceBundle(device=device.result(), routes=routes.result(),
+                                attributes=attributes.result())
+    
+    def get_devices_with_details(self, fields: Optional[Literal["all", "default"]] = "all",
+                                 include: Iterable[str] = ("routes", "attributes", "invites"),
+                                 max_workers: int = 16) -> List[DeviceBundle]:
+        """List all devices along with per-device sub-resources, fetched concurrently.
+        
+        Args:
+            fields: Control which device fields are returned
+            include: Sub-resources to fetch for every device: any of "routes",
+                    "attributes" and "invites"
+            max_workers: Number of concurrent requests; keep it at or below the
+                        client's pool_maxsize so connections are reused
+        
+        Returns:
+            One DeviceBundle per device, in list_devices order
+        """
+        include = tuple(include)
+        unknown = set(include) - _DEVICE_DETAILS.keys()
+        if unknown:
+            raise TspyError(f"Unknown device details: {', '.join(sorted(unknown))}")
+        devices = self.list_devices(fields=fields)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                {name: executor.submit(getattr(self, _DEVICE_DETAILS[name]), device.id) for name in include}
+                for device in devices
+            ]
+            return [
+                DeviceBundle(device=device, **{name: future.result() for name, future in details.items()})
+                for device, details in zip(devices, futures)
+            ]
     
     def set_device_attribute(self, device_id: str, attribute_key: str, value: Any, 
                            expiry: Optional[str] = None, comment: Optional[str] = None) -> Dict[str, Any]:
@@ -130,161 +598,199 @@ class TailscaleClient:
             body["expiry"] = expiry
         if comment:
             body["comment"] = comment
-        return self._request("POST", f"/device/{device_id}/attributes/{attribute_key}", json=body)
+        return self._request("POST", f"{self._device_url}/{device_id}/attributes/{attribute_key}", json=body)
     
     def delete_device_attribute(self, device_id: str, attribute_key: str) -> None:
         """Delete a custom posture attribute from a device."""
-        self._request("DELETE", f"/device/{device_id}/attributes/{attribute_key}")
+        self._request("DELETE", f"{self._device_url}/{device_id}/attributes/{attribute_key}")
     
     # Device invites
     def list_device_invites(self, device_id: str) -> List[Dict[str, Any]]:
         """List all share invites for a device."""
-        data = self._request("GET", f"/device/{device_id}/device-invites")
+        data = self._request("GET", f"{self._device_url}/{device_id}/device-invites")
         return data.get("invites", [])
     
+    def list_device_invites_fast(self, device_id: str) -> List["fastmodels.DeviceInvite"]:
+        """List all share invites for a device as msgspec fastmodels.DeviceInvite structs."""
+        return list(self._paginate(f"{self._device_url}/{device_id}/device-invites",
+                                   _fast_page_decoder("invites", "DeviceInvite")))
+    
     def create_device_invite(self, device_id: str, multiUse: bool = False, 
                            allowExitNode: bool = False, email: Optional[str] = None) -> Dict[str, Any]:
         """Create a device share invite."""
         body = {"multiUse": multiUse, "allowExitNode": allowExitNode}
         if email:
             body["email"] = email
-        return self._request("POST", f"/device/{device_id}/device-invites", json=body)
+        return self._request("POST", f"{self._device_url}/{device_id}/device-invites", json=body)
     
     def get_device_invite(self, invite_id: str) -> Dict[str, Any]:
         """Get details of a device invite."""
-        return self._request("GET", f"/device-invites/{invite_id}")
+        return self._request("GET", f"{self._device_invites_url}/{invite_id}")
     
     def delete_device_invite(self, invite_id: str) -> None:
         """Delete a device invite."""
-        self._request("DELETE", f"/device-invites/{invite_id}")
+        self._request("DELETE", f"{self._device_invites_url}/{invite_id}")
     
     def resend_device_invite(self, invite_id: str) -> None:
         """Resend a device invite email."""
-        self._request("POST", f"/device-invites/{invite_id}/resend")
+        self._request("POST", f"{self._device_invites_url}/{invite_id}/resend")
     
     def accept_device_invite(self, code: str) -> None:
         """Accept a device share invite."""
-        self._request("POST", "/device-invites/-/accept", json={"code": code})
+        self._request("POST", f"{self._device_invites_url}/-/accept", json={"code": code})
     
     # User endpoints
     def list_users(self) -> List[User]:
         """List all users in the tailnet."""
-        data = self._request("GET", f"/tailnet/{self.tailnet}/users")
-        return [User(**user) for user in data.get("users", [])]
+        return list(self.iter_users())
+    
+    def iter_users(self, page_size: Optional[int] = None) -> Iterator[User]:
+        """Iterate over users in the tailnet, fetching pages lazily."""
+        return self._paginate(f"{self._tailnet_url}/users", _USER_PAGE.model_validate_json, page_size=page_size)
     
     def get_user(self, user_id: str) -> User:
         """Get details of a specific user."""
-        data = self._request("GET", f"/tailnet/{self.tailnet}/users/{user_id}")
-        return User(**data)
+        return User.model_validate_json(self._fetch("GET", f"{self._tailnet_url}/users/{user_id}"))
     
     def delete_user(self, user_id: str) -> None:
         """Delete a user from the tailnet."""
-        self._request("DELETE", f"/tailnet/{self.tailnet}/users/{user_id}")
+        self._request("DELETE", f"{self._tailnet_url}/users/{user_id}")
+    
+    def delete_users(self, user_ids: Iterable[str], max_workers: int = 16) -> None:
+        """Delete several users concurrently (see delete_user)."""
+        self._bulk(self.delete_user, user_ids, max_workers)
     
     def approve_user(self, user_id: str) -> None:
         """Approve a user."""
-        self._request("POST", f"/users/{user_id}/approve")
+        self._request("POST", f"{self._users_url}/{user_id}/approve")
     
     def suspend_user(self, user_id: str) -> None:
         """Suspend a user."""
-        self._request("POST", f"/users/{user_id}/suspend")
+        self._request("POST", f"{self._users_url}/{user_id}/suspend")
     
     def restore_user(self, user_id: str) -> None:
         """Restore a suspended user."""
-        self._request("POST", f"/users/{user_id}/restore")
+        self._request("POST", f"{self._users_url}/{user_id}/restore")
     
     def delete_user_v2(self, user_id: str) -> None:
         """Delete a user (v2 endpoint)."""
-        self._request("POST", f"/users/{user_id}/delete")
+        self._request("POST", f"{self._users_url}/{user_id}/delete")
     
     def set_user_role(self, user_id: str, role: str) -> None:
         """Set user role. Valid roles: member, admin, billing, auditor, it-admin"""
-        self._request("POST", f"/users/{user_id}/role", json={"role": role})
+        self._request("POST", f"{self._users_url}/{user_id}/role", json={"role": role})
     
     # User invites
-    def list_user_invites(self) -> List[Dict[str, Any]]:
+    def list_user_invites(self) -> List[UserInvite]:
         """List all user invites."""
-        data = self._request("GET", f"/tailnet/{self.tailnet}/user-invites")
-        return data.get("invites", []) if data else []
+        return list(self._paginate(f"{self._tailnet_url}/user-invites", _USER_INVITE_PAGE.model_validate_json))
+    
+    def list_user_invites_fast(self) -> List["fastmodels.UserInvite"]:
+        """List all user invites as msgspec fastmodels.UserInvite structs."""
+        return list(self._paginate(f"{self._tailnet_url}/user-invites", _fast_page_decoder("invites", "UserInvite")))
     
     def create_user_invite(self, email: str, role: str = "member") -> Dict[str, Any]:
         """Create a user invite."""
-        return self._request("POST", f"/tailnet/{self.tailnet}/user-invites", json={"email": email, "role": role})
+        return self._request("POST", f"{self._tailnet_url}/user-invites", json={"email": email, "role": role})
     
     def get_user_invite(self, invite_id: str) -> Dict[str, Any]:
         """Get details of a user invite."""
-        return self._request("GET", f"/user-invites/{invite_id}")
+        return self._request("GET", f"{self._user_invites_url}/{invite_id}")
     
     def delete_user_invite(self, invite_id: str) -> None:
         """Delete a user invite."""
-        self._request("DELETE", f"/user-invites/{invite_id}")
+        self._request("DELETE", f"{self._user_invites_url}/{invite_id}")
     
     def resend_user_invite(self, invite_id: str) -> None:
         """Resend a user invite email."""
-        self._request("POST", f"/user-invites/{invite_id}/resend")
+        self._request("POST", f"{self._user_invites_url}/{invite_id}/resend")
     
     # ACL endpoints
     def get_acl(self) -> ACL:
         """Get the current ACL configuration."""
-        data = self._request("GET", f"/tailnet/{self.tailnet}/acl")
-        return ACL(**data)
+        return self._conditional_get(f"{self._tailnet_url}/acl", ACL.model_validate_json)
     
     def update_acl(self, acl: Dict[str, Any], if_unmodified_since: Optional[str] = None) -> ACL:
         """Update the ACL configuration."""
         headers = {"If-Unmodified-Since": if_unmodified_since} if if_unmodified_since else None
-        data = self._request("POST", f"/tailnet/{self.tailnet}/acl", json=acl, headers=headers)
-        return ACL(**data)
+        return ACL.model_validate_json(self._fetch("POST", f"{self._tailnet_url}/acl", json=acl, headers=headers))
     
     def preview_acl(self, acl: Dict[str, Any]) -> Dict[str, Any]:
         """Preview ACL changes without applying them."""
-        return self._request("POST", f"/tailnet/{self.tailnet}/acl/preview", json=acl)
+        return self._request("POST", f"{self._tailnet_url}/acl/preview", json=acl)
     
     def validate_acl(self, acl: Dict[str, Any]) -> Dict[str, Any]:
         """Validate an ACL configuration without applying it."""
-        return self._request("POST", f"/tailnet/{self.tailnet}/acl/validate", json=acl)
+        return self._request("POST", f"{self._tailnet_url}/acl/validate", json=acl)
     
     # DNS endpoints
     def get_dns_config(self) -> DNSConfig:
         """Get the current DNS configuration."""
-        data = self._request("GET", f"/tailnet/{self.tailnet}/dns/preferences")
-        return DNSConfig(**data)
+        return self._conditional_get(f"{self._tailnet_url}/dns/preferences", DNSConfig.model_validate_json)
     
     def update_dns_config(self, config: Dict[str, Any]) -> DNSConfig:
         """Update the DNS configuration."""
-        data = self._request("POST", f"/tailnet/{self.tailnet}/dns/preferences", json=config)
-        return DNSConfig(**data)
+        return DNSConfig.model_validate_json(self._fetch("POST", f"{self._tailnet_url}/dns/preferences", json=config))
     
     def get_nameservers(self) -> List[str]:
         """Get the list of DNS nameservers."""
-        data = self._request("GET", f"/tailnet/{self.tailnet}/dns/nameservers")
+        data = self._request("GET", f"{self._tailnet_url}/dns/nameservers")
         return data.get("dns", [])
     
     def set_nameservers(self, nameservers: List[str]) -> None:
         """Set the DNS nameservers."""
-        self._request("POST", f"/tailnet/{self.tailnet}/dns/nameservers", json={"dns": nameservers})
+        self._request("POST", f"{self._tailnet_url}/dns/nameservers", json={"dns": nameservers})
     
     def get_searchpaths(self) -> List[str]:
         """Get the list of DNS search paths."""
-        data = self._request("GET", f"/tailnet/{self.tailnet}/dns/searchpaths")
+        data = self._request("GET", f"{self._tailnet_url}/dns/searchpaths")
         return data.get("searchPaths", [])
     
     def set_searchpaths(self, searchpaths: List[str]) -> None:
         """Set the DNS search paths."""
-        self._request("POST", f"/tailnet/{self.tailnet}/dns/searchpaths", json={"searchPaths": searchpaths})
+        self._request("POST", f"{self._tailnet_url}/dns/searchpaths", json={"searchPaths": searchpaths})
     
     def get_split_dns(self) -> Dict[str, Any]:
         """Get split DNS configuration."""
-        return self._request("GET", f"/tailnet/{self.tailnet}/dns/split-dns")
+        return self._request("GET", f"{self._tailnet_url}/dns/split-dns")
     
     def update_split_dns(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Update split DNS configuration."""
-        return self._request("PATCH", f"/tailnet/{self.tailnet}/dns/split-dns", json=config)
+        return self._request("PATCH", f"{self._tailnet_url}/dns/split-dns", json=config)
     
     # Key endpoints
-    def list_api_keys(self) -> List[Dict[str, Any]]:
+    def _list_keys(self) -> List[Dict[str, Any]]:
+        """Return every key from the keys endpoint, reusing a listing up to _KEYS_TTL seconds old.
+        
+        Callers get their own deep copy of the shared listing.
+        """
+        with self._keys_lock:
+            if self._keys is not None and time.monotonic() - self._keys_fetched < _KEYS_TTL:
+                return copy.deepcopy(self._keys)
+            version = self._keys_version
+        keys = list(self._paginate(self._keys_url, _KEY_DICT_PAGE.model_validate_json))
+        with self._keys_lock:
+            if self._keys_version == version:
+                self._keys, self._keys_fetched = copy.deepcopy(keys), time.monotonic()
+        return keys
+    
+    def _forget_keys(self) -> None:
+        """Drop the shared keys listing and keep in-flight listings from storing theirs."""
+        with self._keys_lock:
+            self._keys = None
+            self._keys_version += 1
+    
+    def list_api_keys(self) -> List[ApiKey]:
         """List all API keys for the tailnet."""
-        data = self._request("GET", f"/tailnet/{self.tailnet}/keys")
-        return data.get("keys", [])
+        return _API_KEY_LIST.validate_python(self._list_keys())
+    
+    def list_api_keys_fast(self) -> List["fastmodels.ApiKey"]:
+        """List all API keys for the tailnet as msgspec fastmodels.ApiKey structs."""
+        return list(self._paginate(self._keys_url, _fast_page_decoder("keys", "ApiKey")))
+    
+    def iter_api_keys(self, page_size: Optional[int] = None) -> Iterator[ApiKey]:
+        """Iterate over API keys for the tailnet, fetching pages lazily."""
+        return self._paginate(self._keys_url, _KEY_PAGE.model_validate_json, page_size=page_size)
     
     def create_api_key(self, capabilities: Dict[str, Any], expiry_seconds: int = 90 * 24 * 60 * 60,
                       description: Optional[str] = None) -> Dict[str, Any]:
@@ -292,21 +798,24 @@ class TailscaleClient:
         body = {"capabilities": capabilities, "expirySeconds": expiry_seconds}
         if description:
             body["description"] = description
-        return self._request("POST", f"/tailnet/{self.tailnet}/keys", json=body)
+        return self._request("POST", self._keys_url, json=body)
     
     def get_api_key(self, key_id: str) -> Dict[str, Any]:
         """Get details of an API key."""
-        return self._request("GET", f"/tailnet/{self.tailnet}/keys/{key_id}")
+        return self._request("GET", f"{self._keys_url}/{key_id}")
     
     def delete_api_key(self, key_id: str) -> None:
         """Delete an API key."""
-        self._request("DELETE", f"/tailnet/{self.tailnet}/keys/{key_id}")
+        self._request("DELETE", f"{self._keys_url}/{key_id}")
+    
+    def delete_api_keys(self, key_ids: Iterable[str], max_workers: int = 16) -> None:
+        """Delete several API keys concurrently (see delete_api_key)."""
+        self._bulk(self.delete_api_key, key_ids, max_workers)
     
     # Auth keys
     def list_auth_keys(self) -> List[Dict[str, Any]]:
         """List all auth keys for the tailnet."""
-        data = self._request("GET", f"/tailnet/{self.tailnet}/keys")
-        return data.get("keys", [])
+        return self._list_keys()
     
     def create_auth_key(self, ephemeral: bool = False, reusable: bool = False, 
                        expiry_seconds: int = 90 * 24 * 60 * 60, 
@@ -327,7 +836,7 @@ class TailscaleClient:
         }
         if description:
             body["description"] = description
-        return self._request("POST", f"/tailnet/{self.tailnet}/keys", json=body)
+        return self._request("POST", self._keys_url, json=body)
     
     # Logging endpoints
     def get_configuration_audit_logs(self, start: str, end: Optional[str] = None,
@@ -342,6 +851,16 @@ class TailscaleClient:
             target: Filter by target
             event: Filter by event type
         """
+        return list(self.iter_configuration_audit_logs(start, end=end, actor=actor, target=target, event=event))
+    
+    def iter_configuration_audit_logs(self, start: str, end: Optional[str] = None,
+                                      actor: Optional[str] = None, target: Optional[str] = None,
+                                      event: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over configuration audit logs without loading the whole response.
+        
+        Takes the same arguments as get_configuration_audit_logs; entries are
+        streamed like iter_network_logs.
+        """
         params = {"start": start}
         if end:
             params["end"] = end
@@ -351,54 +870,110 @@ class TailscaleClient:
             params["target"] = target
         if event:
             params["event"] = event
-        data = self._request("GET", f"/tailnet/{self.tailnet}/logging/configuration", params=params)
-        logs = data.get("logs") if data else None
-        return logs if logs is not None else []
+        return self._iter_items(f"{self._tailnet_url}/logging/configuration", "logs", params=params)
     
+    def poll_configuration_audit_logs(self, start: str, poll_interval: float = 5.0) -> Iterator[Dict[str, Any]]:
+        """Follow configuration audit logs, yielding new entries as they appear.
+        
+        Runs until the caller stops iterating. Once a response has carried an
+        ETag, each tick first sends a HEAD with If-None-Match and only fetches
+        the logs when the server reports a change (anything but 304); without
+        ETags every tick is a GET. After each fetch the window's start moves up
+        to the newest eventTime seen, and entries repeated at that boundary are
+        not yielded twice.
+        
+        Args:
+            start: Start time in RFC 3339 format
+            poll_interval: Seconds to wait between checks
+        """
+        url = f"{self._tailnet_url}/logging/configuration"
+        etag = None
+        boundary: List[Dict[str, Any]] = []
+        while True:
+            params = {"start": start}
+            if etag is not None:
+                head = self._send("HEAD", url, params=params, headers={"If-None-Match": etag})
+                if head.status_code == 304:
+                    time.sleep(poll_interval)
+                    continue
+            
+            response = self._send("GET", url, params=params)
+            etag = response.headers.get("ETag")
+            data = _loads(response.content) if response.content else None
+            logs = [entry for entry in (data.get("logs") or []) if entry not in boundary] if data else []
+            yield from logs
+            
+            timed = [entry for entry in logs if entry.get("eventTime")]
+            if timed:
+                latest = max(timed, key=lambda entry: datetime.fromisoformat(entry["eventTime"]))
+                if latest["eventTime"] != start:
+                    start, boundary = latest["eventTime"], []
+                boundary += [entry for entry in timed if entry["eventTime"] == start]
+            time.sleep(poll_interval)
     
     def get_network_logs(self, start: Optional[str] = None, end: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get network logs."""
+        return list(self.iter_network_logs(start=start, end=end))
+    
+    def get_network_logs_fast(self, start: Optional[str] = None,
+                              end: Optional[str] = None) -> List["fastmodels.NetworkLogEntry"]:
+        """Get network logs decoded by msgspec into frozen fastmodels.NetworkLogEntry structs."""
+        params = {}
+        if start:
+            params["start"] = start
+        if end:
+            params["end"] = end
+        return list(self._paginate(f"{self._tailnet_url}/logging/network",
+                                   _fast_page_decoder("logs", "NetworkLogEntry"), params=params))
+    
+    def iter_network_logs(self, start: Optional[str] = None, end: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over network logs without loading the whole response.
+        
+        Entries are streamed off the connection when ijson is installed, so
+        large log windows can be processed (or abandoned early) in constant memory.
+        """
         params = {}
         if start:
             params["start"] = start
         if end:
             params["end"] = end
-        data = self._request("GET", f"/tailnet/{self.tailnet}/logging/network", params=params)
-        return data.get("logs", [])
+        return self._iter_items(f"{self._tailnet_url}/logging/network", "logs", params=params)
     
     def get_log_stream_status(self, log_type: str) -> Dict[str, Any]:
         """Get log streaming status. Log types: configuration, network, audit"""
-        return self._request("GET", f"/tailnet/{self.tailnet}/logging/{log_type}/stream/status")
+        return self._request("GET", f"{self._tailnet_url}/logging/{log_type}/stream/status")
     
     def set_log_stream(self, log_type: str, destination: str, enabled: bool = True) -> None:
         """Configure log streaming. Log types: configuration, network, audit"""
         body = {"destination": destination, "enabled": enabled}
-        self._request("POST", f"/tailnet/{self.tailnet}/logging/{log_type}/stream", json=body)
+        self._request("POST", f"{self._tailnet_url}/logging/{log_type}/stream", json=body)
     
     def delete_log_stream(self, log_type: str) -> None:
         """Delete log streaming configuration."""
-        self._request("DELETE", f"/tailnet/{self.tailnet}/logging/{log_type}/stream")
+        self._request("DELETE", f"{self._tailnet_url}/logging/{log_type}/stream")
     
     # Contacts endpoints
     def get_contacts(self) -> Dict[str, Any]:
         """Get contact preferences."""
-        return self._request("GET", f"/tailnet/{self.tailnet}/contacts")
+        return self._conditional_get(f"{self._tailnet_url}/contacts", _loads)
     
     def update_contact(self, contact_type: str, email: str) -> Dict[str, Any]:
         """Update contact email. Contact types: security, support, billing"""
-        return self._request("PATCH", f"/tailnet/{self.tailnet}/contacts/{contact_type}", 
+        return self._request("PATCH", f"{self._tailnet_url}/contacts/{contact_type}", 
                            json={"email": email})
     
     def resend_contact_verification(self, contact_type: str) -> None:
         """Resend contact verification email."""
-        self._request("POST", f"/tailnet/{self.tailnet}/contacts/{contact_type}/resend-verification-email")
+        self._request("POST", f"{self._tailnet_url}/contacts/{contact_type}/resend-verification-email")
     
     # Webhook endpoints
-    def list_webhooks(self) -> List[Dict[str, Any]]:
+    def list_webhooks(self) -> List[Webhook]:
         """List all webhook endpoints."""
-        data = self._request("GET", f"/tailnet/{self.tailnet}/webhooks")
-        webhooks = data.get("webhooks") if data else None
-        return webhooks if webhooks is not None else []
+        return list(self.iter_webhooks())
+    
+    def iter_webhooks(self, page_size: Optional[int] = None) -> Iterator[Webhook]:
+        """Iterate over webhook endpoints, fetching pages lazily."""
+        return self._paginate(f"{self._tailnet_url}/webhooks", _WEBHOOK_PAGE.model_validate_json, page_size=page_size)
     
     def create_webhook(self, endpoint_url: str, provider_type: str = "generic",
                       subscriptions: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -406,58 +981,62 @@ class TailscaleClient:
         body = {"endpointUrl": endpoint_url, "providerType": provider_type}
         if subscriptions:
             body["subscriptions"] = subscriptions
-        return self._request("POST", f"/tailnet/{self.tailnet}/webhooks", json=body)
+        return self._request("POST", f"{self._tailnet_url}/webhooks", json=body)
     
     def get_webhook(self, endpoint_id: str) -> Dict[str, Any]:
         """Get webhook endpoint details."""
-        return self._request("GET", f"/webhooks/{endpoint_id}")
+        return self._request("GET", f"{self._webhooks_url}/{endpoint_id}")
     
     def update_webhook(self, endpoint_id: str, subscriptions: List[str]) -> Dict[str, Any]:
         """Update webhook subscriptions."""
-        return self._request("PATCH", f"/webhooks/{endpoint_id}", 
+        return self._request("PATCH", f"{self._webhooks_url}/{endpoint_id}", 
                            json={"subscriptions": subscriptions})
     
     def delete_webhook(self, endpoint_id: str) -> None:
         """Delete a webhook endpoint."""
-        self._request("DELETE", f"/webhooks/{endpoint_id}")
+        self._request("DELETE", f"{self._webhooks_url}/{endpoint_id}")
+    
+    def delete_webhooks(self, endpoint_ids: Iterable[str], max_workers: int = 16) -> None:
+        """Delete several webhook endpoints concurrently (see delete_webhook)."""
+        self._bulk(self.delete_webhook, endpoint_ids, max_workers)
     
     def test_webhook(self, endpoint_id: str) -> None:
         """Send a test event to webhook endpoint."""
-        self._request("POST", f"/webhooks/{endpoint_id}/test")
+        self._request("POST", f"{self._webhooks_url}/{endpoint_id}/test")
     
     def rotate_webhook_secret(self, endpoint_id: str) -> Dict[str, Any]:
         """Rotate webhook signing secret."""
-        return self._request("POST", f"/webhooks/{endpoint_id}/rotate")
+        return self._request("POST", f"{self._webhooks_url}/{endpoint_id}/rotate")
     
     # Tailnet settings
     def get_tailnet_settings(self) -> Dict[str, Any]:
         """Get tailnet settings."""
-        return self._request("GET", f"/tailnet/{self.tailnet}/settings")
+        return self._conditional_get(f"{self._tailnet_url}/settings", _loads)
     
     def update_tailnet_settings(self, settings: Dict[str, Any]) -> Dict[str, Any]:
         """Update tailnet settings."""
-        return self._request("PATCH", f"/tailnet/{self.tailnet}/settings", json=settings)
+        return self._request("PATCH", f"{self._tailnet_url}/settings", json=settings)
     
     # Device posture integrations
-    def list_posture_integrations(self) -> List[Dict[str, Any]]:
+    def list_posture_integrations(self) -> List[PostureIntegration]:
         """List device posture integrations."""
-        data = self._request("GET", f"/tailnet/{self.tailnet}/posture/integrations")
-        return data.get("integrations", [])
+        return list(self._paginate(f"{self._tailnet_url}/posture/integrations",
+                                   _POSTURE_INTEGRATION_PAGE.model_validate_json))
     
     def create_posture_integration(self, provider: str, config: Dict[str, Any]) -> Dict[str, Any]:
         """Create a device posture integration."""
-        return self._request("POST", f"/tailnet/{self.tailnet}/posture/integrations",
+        return self._request("POST", f"{self._tailnet_url}/posture/integrations",
                            json={"provider": provider, "config": config})
     
     def get_posture_integration(self, integration_id: str) -> Dict[str, Any]:
         """Get device posture integration details."""
-        return self._request("GET", f"/tailnet/{self.tailnet}/posture/integrations/{integration_id}")
+        return self._request("GET", f"{self._tailnet_url}/posture/integrations/{integration_id}")
     
     def update_posture_integration(self, integration_id: str, config: Dict[str, Any]) -> Dict[str, Any]:
         """Update device posture integration."""
-        return self._request("PATCH", f"/tailnet/{self.tailnet}/posture/integrations/{integration_id}",
+        return self._request("PATCH", f"{self._tailnet_url}/posture/integrations/{integration_id}",
                            json={"config": config})
     
     def delete_posture_integration(self, integration_id: str) -> None:
         """Delete device posture integration."""
-        self._request("DELETE", f"/tailnet/{self.tailnet}/posture/integrations/{integration_id}")
\ No newline at end of file
+        self._request("DELETE", f"{self._tailnet_url}/posture/integrations/{integration_id}")
\ No newline at end of file
@@ -3,13 +3,18 @@
 
 class TspyError(Exception):
     """Base exception for all tspy errors."""
-    pass
+    __slots__ = ()
 
 
 class TspyAPIError(TspyError):
     """Exception raised for API-related errors."""
+    __slots__ = ("status_code", "response_data")
     
     def __init__(self, message: str, status_code: int | None = None, response_data: dict | None = None):
         super().__init__(message)
         self.status_code = status_code
-        self.response_data = response_data
\ No newline at end of file
+        self.response_data = response_data
+    
+    def __reduce__(self):
+        # Slot attributes aren't part of the default exception pickle state.
+        return type(self), (*self.args, self.status_code, self.response_data)
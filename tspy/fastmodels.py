@@ -0,0 +1,72 @@
+"""msgspec Struct models for decoding large listings.
+
+msgspec decodes JSON straight into slotted structs in a single pass, without
+pydantic's validation machinery, so these suit bulk reads where throughput
+matters more than the richer pydantic models. Requires the optional msgspec
+dependency (``pip install tspy[msgspec]``); importing this module without it
+raises ImportError.
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import msgspec
+
+
+class NetworkLogEntry(msgspec.Struct, frozen=True, rename="camel"):
+    """Represents one node's network flow log for a time window."""
+    logged: datetime
+    node_id: str
+    start: datetime
+    end: datetime
+    virtual_traffic: Optional[List[Dict[str, Any]]] = None
+    subnet_traffic: Optional[List[Dict[str, Any]]] = None
+    exit_traffic: Optional[List[Dict[str, Any]]] = None
+    physical_traffic: Optional[List[Dict[str, Any]]] = None
+
+
+class DeviceInvite(msgspec.Struct, frozen=True, rename="camel"):
+    """Represents a device share invite."""
+    id: str
+    created: datetime
+    multi_use: bool
+    allow_exit_node: bool
+    used: bool
+    device_id: str
+    email: Optional[str] = None
+    expires: Optional[datetime] = None
+
+
+class UserInvite(msgspec.Struct, frozen=True, rename="camel"):
+    """Represents a user invite."""
+    id: str
+    role: str
+    email: Optional[str] = None
+    created_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+    accepted: Optional[bool] = None
+    sent_at: Optional[datetime] = None
+    invite_url: Optional[str] = None
+
+
+class ApiKey(msgspec.Struct, frozen=True, rename="camel"):
+    """Represents an API key. Key listings may only include the id."""
+    id: str
+    description: Optional[str] = None
+    capabilities: Optional[Dict[str, Any]] = None
+    created: Optional[datetime] = None
+    expires: Optional[datetime] = None
+    revoked: Optional[datetime] = None
+
+
+def page_decoder(key: str, item_type: Any) -> Callable[[bytes], Any]:
+    """Build a decoder for one page of a list endpoint.
+
+    The decoded page has the same ``items``/``next_cursor`` shape as the
+    pydantic page envelopes in ``tspy.client``.
+    """
+    page = msgspec.defstruct(f"_{key.title()}Page", [
+        ("items", Optional[List[item_type]], msgspec.field(default=None, name=key)),
+        ("next_cursor", Optional[str], msgspec.field(default=None, name="nextCursor")),
+    ])
+    return msgspec.json.Decoder(page).decode
@@ -2,10 +2,19 @@
 
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
-class Device(BaseModel):
+class _APIModel(BaseModel):
+    """Base for API models.
+    
+    Fields can be populated by their Python names as well as the API's camelCase
+    aliases, and keys the models don't know about are dropped.
+    """
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
+
+
+class Device(_APIModel):
     """Represents a Tailscale device."""
     id: str
     addresses: List[str]
@@ -39,7 +48,7 @@ class Device(BaseModel):
         return v
 
 
-class User(BaseModel):
+class User(_APIModel):
     """Represents a Tailscale user."""
     id: str
     login_name: str = Field(alias="loginName")
@@ -61,7 +70,7 @@ class User(BaseModel):
         return v
 
 
-class ACL(BaseModel):
+class ACL(_APIModel):
     """Represents Tailscale ACL configuration."""
     acls: Optional[List[Dict[str, Any]]] = Field(default_factory=list)
     groups: Optional[Dict[str, List[str]]] = None
@@ -72,7 +81,7 @@ class ACL(BaseModel):
     node_attrs: Optional[List[Dict[str, Any]]] = Field(None, alias="nodeAttrs")
 
 
-class DNSConfig(BaseModel):
+class DNSConfig(_APIModel):
     """Represents DNS configuration."""
     domains: Optional[List[str]] = Field(default_factory=list)
     magic_dns: bool = Field(alias="magicDNS")
@@ -81,18 +90,31 @@ class DNSConfig(BaseModel):
     routes: Optional[Dict[str, List[str]]] = None
 
 
-class DeviceRoutes(BaseModel):
+class DeviceRoutes(_APIModel):
     """Represents device routes configuration."""
+    model_config = ConfigDict(frozen=True)
     advertised_routes: List[str] = Field(alias="advertisedRoutes")
     enabled_routes: List[str] = Field(alias="enabledRoutes")
 
 
-class DevicePostureAttributes(BaseModel):
+class DeviceBundle(_APIModel):
+    """A device together with its subnet routes, posture attributes and share invites.
+    
+    Sub-resources that were not requested are left as None.
+    """
+    device: Device
+    routes: Optional[Dict[str, Any]] = None
+    attributes: Optional[Dict[str, Any]] = None
+    invites: Optional[List[Dict[str, Any]]] = None
+
+
+class DevicePostureAttributes(_APIModel):
     """Device posture attributes."""
+    model_config = ConfigDict(frozen=True)
     attributes: Dict[str, Union[str, int, bool]]
 
 
-class DeviceInvite(BaseModel):
+class DeviceInvite(_APIModel):
     """Represents a device share invite."""
     id: str
     created: datetime
@@ -104,28 +126,29 @@ class DeviceInvite(BaseModel):
     expires: Optional[datetime] = None
 
 
-class UserInvite(BaseModel):
+class UserInvite(_APIModel):
     """Represents a user invite."""
     id: str
-    email: str
+    email: Optional[str] = None
     role: str
-    created_at: datetime = Field(alias="createdAt")
-    expires_at: datetime = Field(alias="expiresAt")
-    accepted: bool
+    created_at: Optional[datetime] = Field(None, alias="createdAt")
+    expires_at: Optional[datetime] = Field(None, alias="expiresAt")
+    accepted: Optional[bool] = None
     sent_at: Optional[datetime] = Field(None, alias="sentAt")
+    invite_url: Optional[str] = Field(None, alias="inviteUrl")
 
 
-class ApiKey(BaseModel):
-    """Represents an API key."""
+class ApiKey(_APIModel):
+    """Represents an API key. Key listings may only include the id."""
     id: str
     description: Optional[str] = None
-    capabilities: Dict[str, Any]
-    created: datetime
-    expires: datetime
+    capabilities: Optional[Dict[str, Any]] = None
+    created: Optional[datetime] = None
+    expires: Optional[datetime] = None
     revoked: Optional[datetime] = None
 
 
-class AuthKey(BaseModel):
+class AuthKey(_APIModel):
     """Represents an auth key."""
     id: str
     description: Optional[str] = None
@@ -135,22 +158,24 @@ class AuthKey(BaseModel):
     revoked: Optional[datetime] = None
 
 
-class LogEntry(BaseModel):
+class LogEntry(_APIModel):
     """Represents a log entry."""
+    model_config = ConfigDict(frozen=True)
     timestamp: datetime
     type: str
     message: str
     data: Optional[Dict[str, Any]] = None
 
 
-class ContactPreference(BaseModel):
+class ContactPreference(_APIModel):
     """Represents contact preferences."""
+    model_config = ConfigDict(frozen=True)
     security: Optional[str] = None
     support: Optional[str] = None
     billing: Optional[str] = None
 
 
-class Webhook(BaseModel):
+class Webhook(_APIModel):
     """Represents a webhook endpoint."""
     endpoint_id: str = Field(alias="endpointId")
     endpoint_url: str = Field(alias="endpointUrl")
@@ -161,7 +186,7 @@ class Webhook(BaseModel):
     secret: Optional[str] = None
 
 
-class TailnetSettings(BaseModel):
+class TailnetSettings(_APIModel):
     """Represents tailnet settings."""
     devices_approval_on: Optional[bool] = Field(None, alias="devicesApprovalOn")
     devices_auto_updates_on: Optional[bool] = Field(None, alias="devicesAutoUpdatesOn")
@@ -173,9 +198,9 @@ class TailnetSettings(BaseModel):
     enhanced_security_features_on: Optional[bool] = Field(None, alias="enhancedSecurityFeaturesOn")
 
 
-class PostureIntegration(BaseModel):
+class PostureIntegration(_APIModel):
     """Represents a device posture integration."""
     id: str
     provider: str
-    created_at: datetime = Field(alias="createdAt")
-    config: Dict[str, Any]
\ No newline at end of file
+    created_at: Optional[datetime] = Field(None, alias="createdAt")
+    config: Optional[Dict[str, Any]] = None
\ No newline at end of file